@@ -3,7 +3,9 @@ Application factory - builds FastAPI app with all middleware and routes.
 Pattern mirrors AutoArt's buildApp().
 """
 
+import asyncio
 from collections.abc import AsyncGenerator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import Any
 
@@ -51,6 +53,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Setup logging
     setup_logging(settings.log_level)
 
+    # Size the executor behind asyncio.to_thread for I/O-bound work
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=settings.thread_pool_size, thread_name_prefix="autohelper")
+    )
+
     from autohelper.shared.platform import platform_label
     logger.info("Starting AutoHelper on %s...", platform_label())
 
@@ -7,6 +7,7 @@ For values that need to persist across restarts (like autoart_link_key),
 we read from config.json during Settings initialization.
 """
 
+import os
 from pathlib import Path
 from typing import Literal
 
@@ -80,6 +81,16 @@ class Settings(BaseSettings):
     sharepoint_client_id: str | None = None
     sharepoint_client_secret: str | None = None
 
+    # Worker threads for blocking I/O offloaded with asyncio.to_thread
+    thread_pool_size: int = Field(default_factory=lambda: min(64, (os.cpu_count() or 4) * 4), ge=1)
+
+    # Runner Settings
+    # Files hashed and copied at once during folder collection (default: min(32, 4 * CPUs))
+    collect_concurrency: int | None = Field(default=None, ge=1)
+    # "hardlink"/"reflink" avoid copying data when source and output share a filesystem;
+    # hardlinked artifacts share edits with their source file
+    collect_copy_mode: Literal["copy", "hardlink", "reflink"] = "copy"
+
     # Garbage Collection Settings
     gc_enabled: bool = True  # Enable/disable GC scheduler
     gc_schedule_hours: int = Field(default=24, ge=1)  # Run every N hours (min: 1)
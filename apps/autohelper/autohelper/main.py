@@ -51,7 +51,7 @@ def _run_with_tray(server: uvicorn.Server) -> None:
             host=settings.host,
             port=settings.port,
             log_level=settings.log_level.lower(),
-            loop="asyncio",
+            loop="auto",  # Same loop selection as the primary server config
         )
         uvicorn.Server(fallback_config).run()
         return
@@ -69,12 +69,16 @@ def main() -> None:
     print(f"Docs: http://{settings.host}:{settings.port}/docs")
     print(f"Platform: {platform_label()}")
 
+    # "auto" selects uvloop when installed (uvicorn[standard], non-Windows),
+    # which lowers per-callback overhead for the runner's download fan-out.
+    # SSRF validation resolves hosts with loop.getaddrinfo behind a TTL cache,
+    # which uvloop also serves natively.
     config = uvicorn.Config(
         build_app(settings),
         host=settings.host,
         port=settings.port,
         log_level=settings.log_level.lower(),
-        loop="asyncio",
+        loop="auto",
     )
     server = uvicorn.Server(config)
 
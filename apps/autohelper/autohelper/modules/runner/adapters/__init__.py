@@ -19,7 +19,8 @@ class AdapterRegistry:
 
     _adapters: list[SiteAdapter] = []
     _default: SiteAdapter | None = None
-    _lock: threading.Lock = threading.Lock()
+    # Reentrant: _register_adapters() calls register() while holding the lock
+    _lock = threading.RLock()
     _initialized: bool = False
 
     @classmethod
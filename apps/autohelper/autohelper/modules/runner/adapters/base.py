@@ -81,6 +81,24 @@ class SiteAdapter(ABC):
             List of absolute image URLs
         """
 
+    async def extract_images_multi(self, pages: list[tuple[str, "BeautifulSoup"]]) -> list[str]:
+        """
+        Extract image URLs from several pages of the same site.
+
+        The default runs extract_images per page; override to share work
+        across pages, such as a single worker-thread hop.
+
+        Args:
+            pages: (page URL, parsed HTML document) pairs
+
+        Returns:
+            Image URLs of every page, concatenated in page order
+        """
+        urls: list[str] = []
+        for page_url, soup in pages:
+            urls.extend(await self.extract_images(soup, page_url))
+        return urls
+
     async def extract_bio(self, soup: "BeautifulSoup") -> str | None:
         """
         Extract bio/about text from the page.
@@ -121,18 +139,16 @@ class SiteAdapter(ABC):
         self, soup: "BeautifulSoup", base_url: str, bio_text: str | None
     ) -> ExtractedMetadata:
         """Synchronous implementation of metadata extraction."""
-        from ..extractors.contact import extract_emails, extract_location, extract_phones
-        from ..extractors.documents import extract_cv_links
+        from ..extractors.contact import extract_location
+        from ..extractors.links import extract_page_links
 
-        emails = extract_emails(soup)
-        phones = extract_phones(soup)
-        cv_links = extract_cv_links(soup, base_url)
+        links = extract_page_links(soup, base_url)
         location, location_candidates = extract_location(soup, bio_text)
 
         return ExtractedMetadata(
-            emails=emails,
-            phones=phones,
-            cv_links=cv_links,
+            emails=links.emails,
+            phones=links.phones,
+            cv_links=links.cv_links,
             location=location,
             raw_location_candidates=location_candidates,
         )
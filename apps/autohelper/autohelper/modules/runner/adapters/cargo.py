@@ -32,6 +32,17 @@ def _get_str_attr(tag: "Tag", attr: str, default: str = "") -> str:
 # Supported image extensions
 SUPPORTED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tiff"}
 
+# Original-size images on the Cargo CDN (preferred)
+ORIGINAL_IMAGE_RE = re.compile(
+    r'freight\.cargo\.site/t/original/[^"\s\\<>\']+\.(jpg|jpeg|png|gif|webp)', re.I
+)
+
+# Any image on the Cargo CDN (originals and width-scaled variants)
+FREIGHT_IMAGE_RE = re.compile(r'freight\.cargo\.site/[^"\s\\<>\']+\.(jpg|jpeg|png|gif|webp)', re.I)
+
+# Width segment of thumbnail URLs: /w/{width}/
+THUMBNAIL_WIDTH_RE = re.compile(r"/w/(\d+)/")
+
 
 class CargoAdapter(SiteAdapter):
     """
@@ -129,9 +140,8 @@ class CargoAdapter(SiteAdapter):
         urls: list[str] = []
         html_text = str(soup)
 
-        # Pattern for original images (preferred)
-        original_pattern = r'freight\.cargo\.site/t/original/[^"\s\\<>\']+\.(jpg|jpeg|png|gif|webp)'
-        for match in re.finditer(original_pattern, html_text, re.IGNORECASE):
+        # Original images are preferred
+        for match in ORIGINAL_IMAGE_RE.finditer(html_text):
             url = "https://" + match.group(0).replace("\\/", "/")
             if self._is_supported_image(url):
                 urls.append(url)
@@ -182,7 +192,7 @@ class CargoAdapter(SiteAdapter):
         self, soup: "BeautifulSoup", metadata: ExtractedMetadata
     ) -> ExtractedMetadata:
         """Synchronous Cargo-specific metadata extraction."""
-        from ..extractors.contact import extract_emails, extract_phones
+        from ..extractors.links import extract_page_links
 
         # Cargo-specific: check footer and contact sections for contact info
         contact_selectors = [
@@ -197,14 +207,14 @@ class CargoAdapter(SiteAdapter):
         for selector in contact_selectors:
             section = soup.select_one(selector)
             if section:
-                section_emails = extract_emails(section)
-                section_phones = extract_phones(section)
+                # No base URL: contacts only, document links are not collected
+                section_links = extract_page_links(section)
 
                 # Merge, prioritizing contact section (often has canonical contact)
-                for email in section_emails:
+                for email in section_links.emails:
                     if email not in metadata.emails:
                         metadata.emails.insert(0, email)
-                for phone in section_phones:
+                for phone in section_links.phones:
                     if phone not in metadata.phones:
                         metadata.phones.insert(0, phone)
 
@@ -254,8 +264,7 @@ class CargoAdapter(SiteAdapter):
         for script in soup.find_all("script"):
             script_text = script.string or ""
             # Find freight.cargo.site URLs in any script content
-            pattern = r'freight\.cargo\.site/[^"\s\\<>\']+\.(jpg|jpeg|png|gif|webp)'
-            for match in re.finditer(pattern, script_text, re.IGNORECASE):
+            for match in FREIGHT_IMAGE_RE.finditer(script_text):
                 url = "https://" + match.group(0).replace("\\/", "/")
                 # Separate originals from thumbnails to preserve discovery order
                 if "/t/original/" in url:
@@ -280,7 +289,7 @@ class CargoAdapter(SiteAdapter):
                 # Skip small thumbnails (width-based URLs)
                 if "/w/" in full_url:
                     # Check if it's a very small thumbnail
-                    width_match = re.search(r"/w/(\d+)/", full_url)
+                    width_match = THUMBNAIL_WIDTH_RE.search(full_url)
                     if width_match:
                         width = int(width_match.group(1))
                         if width < 800:  # Skip thumbnails under 800px
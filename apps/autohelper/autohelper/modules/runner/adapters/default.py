@@ -4,6 +4,7 @@ Default site adapter for generic HTML pages.
 Uses standard HTML extraction logic as a fallback for unknown sites.
 """
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from ..extractors import extract_bio_text, extract_image_urls
@@ -40,6 +41,16 @@ class DefaultAdapter(SiteAdapter):
         # Use existing extraction logic from extractors module
         return extract_image_urls(soup, base_url)
 
+    async def extract_images_multi(self, pages: list[tuple[str, "BeautifulSoup"]]) -> list[str]:
+        # One worker-thread hop for every page, keeping tree walks off the event loop
+        def _extract_all() -> list[str]:
+            urls: list[str] = []
+            for page_url, soup in pages:
+                urls.extend(extract_image_urls(soup, page_url))
+            return urls
+
+        return await asyncio.to_thread(_extract_all)
+
     async def extract_bio(self, soup: "BeautifulSoup") -> str | None:
         # Use existing bio extraction logic
         return extract_bio_text(soup)
@@ -12,10 +12,11 @@ from typing import Any
 
 from pydantic import ValidationError
 
+from autohelper.config.settings import get_settings
 from autohelper.config.store import ConfigStore
 from autohelper.shared.logging import get_logger
 
-from .collectors import FolderCollector, WebCollector
+from .collectors import MAX_CONCURRENT_FILES, FolderCollector, WebCollector
 from .service import BaseRunner
 from .types import NamingConfig, RunnerId, RunnerProgress, RunnerResult
 
@@ -53,7 +54,11 @@ class AutoCollectorRunner(BaseRunner):
     def __init__(self) -> None:
         """Initialize the collector with web and folder handlers."""
         self._config_store = ConfigStore()
-        self._folder_collector = FolderCollector()
+        settings = get_settings()
+        self._folder_collector = FolderCollector(
+            max_concurrent_files=settings.collect_concurrency or MAX_CONCURRENT_FILES,
+            copy_mode=settings.collect_copy_mode,
+        )
 
     async def _get_web_collector(self) -> WebCollector:
         """Create WebCollector with current settings from config."""
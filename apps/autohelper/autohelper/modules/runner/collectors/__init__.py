@@ -5,25 +5,32 @@ Provides artifact collectors for different source types (web, folder).
 """
 
 from .base import (
+    MAX_CONCURRENT_DOWNLOADS,
+    MAX_CONCURRENT_FILES,
     MAX_IMAGES,
     REQUEST_TIMEOUT,
     SUPPORTED_DOCUMENT_EXTENSIONS,
     SUPPORTED_IMAGE_EXTENSIONS,
     CollectorProtocol,
     get_artifact_type,
+    open_source_folder,
     scan_files_safe,
 )
-from .folder import FolderCollector
+from .folder import CopyMode, FolderCollector
 from .web import WebCollector
 
 __all__ = [
     "CollectorProtocol",
     "WebCollector",
     "FolderCollector",
+    "CopyMode",
     "scan_files_safe",
+    "open_source_folder",
     "get_artifact_type",
     "SUPPORTED_IMAGE_EXTENSIONS",
     "SUPPORTED_DOCUMENT_EXTENSIONS",
     "MAX_IMAGES",
+    "MAX_CONCURRENT_DOWNLOADS",
+    "MAX_CONCURRENT_FILES",
     "REQUEST_TIMEOUT",
 ]
@@ -6,7 +6,8 @@ Provides the CollectorProtocol interface and shared utilities for artifact colle
 
 import asyncio
 import logging
-from collections.abc import AsyncIterator
+import os
+from collections.abc import AsyncIterator, Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Protocol
 
@@ -21,12 +22,24 @@ SUPPORTED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp",
 # Supported document extensions
 SUPPORTED_DOCUMENT_EXTENSIONS = {".txt", ".md", ".doc", ".docx", ".pdf"}
 
+# Artifact type by extension, for a single lookup per file
+_ARTIFACT_TYPES = {
+    **dict.fromkeys(SUPPORTED_DOCUMENT_EXTENSIONS, "document"),
+    **dict.fromkeys(SUPPORTED_IMAGE_EXTENSIONS, "image"),
+}
+
 # Maximum images per collection
 MAX_IMAGES = 50
 
 # Default request timeout in seconds
 REQUEST_TIMEOUT = 30.0
 
+# Maximum concurrent downloads per collection
+MAX_CONCURRENT_DOWNLOADS = 8
+
+# Maximum files hashed and copied at once by the folder collector
+MAX_CONCURRENT_FILES = min(32, (os.cpu_count() or 1) * 4)
+
 
 class CollectorProtocol(Protocol):
     """Protocol for artifact collectors."""
@@ -84,16 +97,16 @@ def get_artifact_type(extension: str) -> str:
     Returns:
         Artifact type: "image", "document", or "file"
     """
+    # Fast path: callers usually pass a lowercased Path.suffix
+    artifact_type = _ARTIFACT_TYPES.get(extension)
+    if artifact_type is not None:
+        return artifact_type
+
     ext = extension.lower()
     if not ext.startswith("."):
         ext = f".{ext}"
 
-    if ext in SUPPORTED_IMAGE_EXTENSIONS:
-        return "image"
-    elif ext in SUPPORTED_DOCUMENT_EXTENSIONS:
-        return "document"
-    else:
-        return "file"
+    return _ARTIFACT_TYPES.get(ext, "file")
 
 
 async def scan_files_safe(source_path: Path) -> list[Path]:
@@ -102,7 +115,7 @@ async def scan_files_safe(source_path: Path) -> list[Path]:
 
     - Does not follow symlinked directories during traversal
     - Resolves symlinked files and validates targets stay within source
-    - Deduplicates files (multiple symlinks to same target)
+    - Deduplicates files (symlinks or hardlinks to the same file)
     - Skips inaccessible files gracefully
 
     Args:
@@ -111,53 +124,158 @@ async def scan_files_safe(source_path: Path) -> list[Path]:
     Returns:
         List of resolved file paths within the source directory
     """
-    resolved_source = source_path.resolve()
+    return await asyncio.to_thread(lambda: _scan_files(source_path.resolve()))
 
-    def _scan() -> list[Path]:
-        safe_files = []
-        seen_paths: set[Path] = set()
-        dirs_to_scan = [resolved_source]
 
-        while dirs_to_scan:
-            current_dir = dirs_to_scan.pop()
-            try:
-                entries = list(current_dir.iterdir())
-            except (OSError, PermissionError) as e:
-                logger.warning(f"Skipping inaccessible directory {current_dir}: {e}")
-                continue
+async def open_source_folder(source_path: Path) -> tuple[Path, list[Path]]:
+    """
+    Validate a source folder and scan it in a single executor hop.
 
-            for item in entries:
-                try:
-                    # For directories, only recurse if not a symlink
-                    if item.is_dir():
-                        if not item.is_symlink():
-                            dirs_to_scan.append(item)
-                        else:
-                            logger.debug(f"Skipping symlinked directory: {item}")
-                        continue
+    Args:
+        source_path: Directory to collect from
+
+    Returns:
+        Tuple of (resolved source directory, files as returned by scan_files_safe)
+
+    Raises:
+        FileNotFoundError: If source_path does not exist
+        NotADirectoryError: If source_path is not a directory
+    """
 
-                    if not item.is_file():
+    def _open() -> tuple[Path, list[Path]]:
+        # One stat on the common path; exists() only runs to pick the error
+        if not source_path.is_dir():
+            if not source_path.exists():
+                raise FileNotFoundError(f"Source path does not exist: {source_path}")
+            raise NotADirectoryError(f"Source path is not a directory: {source_path}")
+        resolved_source = source_path.resolve()
+        return resolved_source, _scan_files(resolved_source)
+
+    return await asyncio.to_thread(_open)
+
+
+def _scan_files(resolved_source: Path) -> list[Path]:
+    """Walk an already-resolved directory; see scan_files_safe."""
+    safe_files = []
+    # (st_dev, st_ino) of every file kept, so links and hardlinks to the
+    # same data are collected once
+    seen_files: set[tuple[int, int]] = set()
+    # Symlink target directory -> canonical path, shared by sibling links
+    canonical_dirs: dict[str, Path] = {}
+    dirs_to_scan = [str(resolved_source)]
+    # Canonical paths inside the source start with this prefix
+    source_prefix = os.path.normcase(os.path.join(resolved_source, ""))
+
+    while dirs_to_scan:
+        current_dir = dirs_to_scan.pop()
+        try:
+            # Regular files share their directory's device; readdir supplies the inode
+            dir_dev = os.stat(current_dir).st_dev
+        except (OSError, PermissionError) as e:
+            logger.warning(f"Skipping inaccessible directory {current_dir}: {e}")
+            continue
+
+        for entry in _iter_dir(current_dir):
+            try:
+                # Classify from the d_type cached by readdir; only symlinks
+                # need a stat() to learn what they point at
+                is_link = entry.is_symlink()
+                if is_link:
+                    if entry.is_dir():
+                        # Never follow symlinked directories
+                        logger.debug(f"Skipping symlinked directory: {entry.path}")
+                        continue
+                    if not entry.is_file():
                         continue
-                except (OSError, PermissionError) as e:
-                    logger.warning(f"Skipping inaccessible item {item}: {e}")
+                elif entry.is_dir(follow_symlinks=False):
+                    dirs_to_scan.append(entry.path)
+                    continue
+                elif not entry.is_file(follow_symlinks=False):
                     continue
+            except (OSError, PermissionError) as e:
+                logger.warning(f"Skipping inaccessible item {entry.path}: {e}")
+                continue
 
+            item = Path(entry.path)
+
+            if is_link:
                 # Resolve symlinks and verify target is within source
                 try:
-                    resolved_item = item.resolve()
-                    # Check if resolved path is within the source directory
-                    resolved_item.relative_to(resolved_source)
-                    # Skip if already seen (multiple symlinks to same target)
-                    if resolved_item in seen_paths:
-                        continue
-                    seen_paths.add(resolved_item)
-                    safe_files.append(resolved_item)
-                except (ValueError, OSError) as e:
-                    # ValueError: Path is outside source_path (symlink escape attempt)
-                    # OSError: Could not resolve path
+                    resolved_item = _resolve_file_link(entry.path, canonical_dirs)
+                    target_stat = os.stat(resolved_item)
+                except OSError as e:
                     logger.warning(f"Skipping file {item}: {e}")
                     continue
+                # Both sides are canonical, so a prefix check is enough to
+                # catch symlink escape attempts
+                if not os.path.normcase(resolved_item).startswith(source_prefix):
+                    logger.warning(
+                        f"Skipping file {item}: target {resolved_item} is outside source"
+                    )
+                    continue
+                file_key = (target_stat.st_dev, target_stat.st_ino)
+            else:
+                # Reached from resolved_source through real directories only,
+                # so the path is already canonical and inside the source
+                resolved_item = item
+                try:
+                    file_key = (dir_dev, entry.inode())
+                except OSError as e:
+                    logger.warning(f"Skipping inaccessible item {entry.path}: {e}")
+                    continue
+
+            # Skip if already seen (symlinks or hardlinks to the same file)
+            if file_key in seen_files:
+                continue
+            seen_files.add(file_key)
+            safe_files.append(resolved_item)
+
+    return safe_files
+
+
+def _iter_dir(current_dir: str) -> Iterator[os.DirEntry[str]]:
+    """
+    Yield a directory's entries as readdir produces them.
+
+    Entries are streamed rather than listed up front, so huge directories
+    are never held in memory at once. Read errors end the directory early.
+    """
+    try:
+        with os.scandir(current_dir) as it:
+            yield from it
+    except (OSError, PermissionError) as e:
+        logger.warning(f"Skipping inaccessible directory {current_dir}: {e}")
+
+
+def _resolve_file_link(link_path: str, canonical_dirs: dict[str, Path]) -> Path:
+    """
+    Resolve a symlinked file, memoizing the canonical form of target directories.
+
+    Links into the same directory share one realpath walk of that directory;
+    only the final component is checked per link.
 
-        return safe_files
+    Args:
+        link_path: Path of the symlink (its parent must already be canonical)
+        canonical_dirs: Cache of target directory -> canonical directory
 
-    return await asyncio.to_thread(_scan)
+    Returns:
+        Canonical path of the link target
+    """
+    if os.name == "nt":
+        # Windows resolves a whole path in one call; nothing to amortize
+        return Path(link_path).resolve()
+
+    target = os.path.join(os.path.dirname(link_path), os.readlink(link_path))
+    target_dir, name = os.path.split(target)
+    if name in ("", ".", ".."):
+        return Path(link_path).resolve()
+
+    canonical_dir = canonical_dirs.get(target_dir)
+    if canonical_dir is None:
+        canonical_dir = canonical_dirs[target_dir] = Path(target_dir).resolve()
+
+    candidate = canonical_dir / name
+    if candidate.is_symlink():
+        # Chained link: resolve the rest of the chain in full
+        return candidate.resolve()
+    return candidate
@@ -5,19 +5,26 @@ Collects artifacts from local folders with symlink safety and manifest tracking.
 """
 
 import asyncio
+import functools
 import logging
 import mimetypes
+import os
 import shutil
+import sys
+import tempfile
+import time
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import Literal
 
 from ..naming import (
     IndexCounter,
     compute_content_hash_streaming,
     generate_filename,
     generate_persistent_id_from_hash,
+    new_content_hasher,
 )
 from ..types import (
     ArtifactManifestEntry,
@@ -28,12 +35,144 @@ from ..types import (
     RunnerResult,
 )
 from .base import (
+    MAX_CONCURRENT_FILES,
     get_artifact_type,
-    scan_files_safe,
+    open_source_folder,
 )
 
 logger = logging.getLogger(__name__)
 
+# How collected files reach the output folder: copied, hardlinked to the
+# source, or cloned copy-on-write (Linux btrfs/XFS)
+CopyMode = Literal["copy", "hardlink", "reflink"]
+
+# Linux ioctl that clones a file's extents into another file
+_FICLONE = 0x40049409
+
+# Minimum time between streamed progress events
+PROGRESS_INTERVAL_SECONDS = 0.1
+
+# Read size for the combined hash-and-copy pass. Larger blocks measured
+# slower: the 64 KiB buffer stays in cache between hashing and writing
+COPY_CHUNK_SIZE = 65536
+
+
+@functools.lru_cache(maxsize=256)
+def _mime_type_for_extension(ext: str) -> str | None:
+    """Guess the MIME type for a lowercased extension (cached)."""
+    return mimetypes.guess_type(f"file{ext}")[0]
+
+
+def _guess_mime_type(item: Path, ext: str) -> str | None:
+    """Guess a file's MIME type, reusing the per-extension cache when possible."""
+    if ext in mimetypes.encodings_map or ext in mimetypes.suffix_map:
+        # Compound suffixes like .tar.gz depend on more than the last extension
+        return mimetypes.guess_type(item.name)[0]
+    return _mime_type_for_extension(ext)
+
+
+def _make_output_dirs(output_folder: Path, resolved_source: Path, files: list[Path]) -> None:
+    """Create the output folder and each distinct destination directory once."""
+    output_folder.mkdir(parents=True, exist_ok=True)
+    for parent in {item.parent for item in files}:
+        if parent != resolved_source:
+            (output_folder / parent.relative_to(resolved_source)).mkdir(parents=True, exist_ok=True)
+
+
+def _copy_file(
+    item: Path,
+    dest_dir: Path,
+    filename_for_hash: Callable[[str], str],
+    copy_mode: CopyMode = "copy",
+) -> tuple[str, int, Path]:
+    """
+    Copy a file into dest_dir (which must exist), hashing it in the same read pass.
+
+    The copy lands in a temporary file first and is renamed once the hash,
+    and with it the generated filename, is known. Runs synchronously so a
+    worker thread handles the whole file in one hop.
+
+    With copy_mode "hardlink" or "reflink" the file is linked or cloned
+    instead, falling back to a copy when the filesystem refuses.
+
+    Returns:
+        Tuple of (content_hash, file_size, dest_path)
+    """
+    if copy_mode != "copy":
+        linked = _link_file(item, dest_dir, filename_for_hash, copy_mode)
+        if linked is not None:
+            return linked
+
+    hasher = new_content_hasher()
+    file_size = 0
+    buffer = bytearray(COPY_CHUNK_SIZE)
+    view = memoryview(buffer)
+
+    fd, tmp_name = tempfile.mkstemp(suffix=".part", dir=dest_dir)
+    tmp_path = Path(tmp_name)
+    try:
+        # Wrap fd first so it is closed even if the source cannot be opened
+        with os.fdopen(fd, "wb") as dst, open(item, "rb") as src:
+            while read := src.readinto(buffer):
+                chunk = view[:read]
+                hasher.update(chunk)
+                dst.write(chunk)
+                file_size += read
+        shutil.copystat(item, tmp_path)
+
+        content_hash = hasher.hexdigest()
+        dest_path = dest_dir / filename_for_hash(content_hash)
+        tmp_path.replace(dest_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return content_hash, file_size, dest_path
+
+
+def _link_file(
+    item: Path,
+    dest_dir: Path,
+    filename_for_hash: Callable[[str], str],
+    copy_mode: CopyMode,
+) -> tuple[str, int, Path] | None:
+    """
+    Hardlink or reflink a file into dest_dir without copying its data.
+
+    Returns:
+        Tuple of (content_hash, file_size, dest_path), or None if the
+        filesystem cannot link or clone the file
+    """
+    if copy_mode == "reflink" and sys.platform != "linux":
+        return None
+
+    fd, tmp_name = tempfile.mkstemp(suffix=".part", dir=dest_dir)
+    tmp_path = Path(tmp_name)
+    try:
+        try:
+            if copy_mode == "hardlink":
+                os.close(fd)
+                tmp_path.unlink()
+                os.link(item, tmp_path)
+            else:
+                import fcntl
+
+                with os.fdopen(fd, "wb") as dst, open(item, "rb") as src:
+                    fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+                shutil.copystat(item, tmp_path)
+        except OSError as e:
+            logger.debug(f"Cannot {copy_mode} {item}, copying instead: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return None
+
+        content_hash = compute_content_hash_streaming(item, COPY_CHUNK_SIZE)
+        file_size = tmp_path.stat().st_size
+        dest_path = dest_dir / filename_for_hash(content_hash)
+        tmp_path.replace(dest_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return content_hash, file_size, dest_path
+
 
 class FolderCollector:
     """
@@ -43,9 +182,21 @@ class FolderCollector:
     and creates manifest entries for tracking.
     """
 
-    def __init__(self) -> None:
-        """Initialize the folder collector."""
-        pass
+    def __init__(
+        self,
+        max_concurrent_files: int = MAX_CONCURRENT_FILES,
+        copy_mode: CopyMode = "copy",
+    ) -> None:
+        """
+        Initialize the folder collector.
+
+        Args:
+            max_concurrent_files: Maximum files hashed and copied at once
+            copy_mode: "copy", or "hardlink"/"reflink" to share the source's
+                data when source and output are on the same filesystem
+        """
+        self.max_concurrent_files = max_concurrent_files
+        self.copy_mode = copy_mode
 
     async def collect(
         self,
@@ -68,28 +219,19 @@ class FolderCollector:
         """
         source_path = Path(source)
 
-        # Validate source path
-        exists = await asyncio.to_thread(source_path.exists)
-        if not exists:
-            return RunnerResult(
-                success=False,
-                error=f"Source path does not exist: {source_path}",
-            )
-
-        is_dir = await asyncio.to_thread(source_path.is_dir)
-        if not is_dir:
-            return RunnerResult(
-                success=False,
-                error=f"Source path is not a directory: {source_path}",
-            )
+        # Validate and scan the source path in one executor hop
+        try:
+            resolved_source, files = await open_source_folder(source_path)
+        except (FileNotFoundError, NotADirectoryError) as e:
+            return RunnerResult(success=False, error=str(e))
 
         artifacts: list[ArtifactRef] = []
         manifest_entries: list[ArtifactManifestEntry] = []
         now = datetime.now(UTC).isoformat()
 
         try:
-            # Ensure output folder exists
-            await asyncio.to_thread(output_folder.mkdir, parents=True, exist_ok=True)
+            # Create the output folder and its subdirectories in one executor hop
+            await asyncio.to_thread(_make_output_dirs, output_folder, resolved_source, files)
 
             # Initialize index counter
             counter = IndexCounter(
@@ -97,19 +239,15 @@ class FolderCollector:
                 mode=naming_config.numbering_mode,
             )
 
-            # Scan files safely
-            resolved_source = await asyncio.to_thread(source_path.resolve)
-            files = await scan_files_safe(source_path)
-
-            for item in files:
-                result = await self._process_file(
-                    item,
-                    resolved_source,
-                    output_folder,
-                    counter,
-                    naming_config,
-                    now,
-                )
+            tasks = self._start_file_tasks(
+                files, resolved_source, output_folder, counter, naming_config, now
+            )
+            try:
+                results = await asyncio.gather(*tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+            for result in results:
                 if result:
                     artifact, entry = result
                     artifacts.append(artifact)
@@ -153,29 +291,19 @@ class FolderCollector:
             percent=10,
         )
 
-        # Validate source path
-        exists = await asyncio.to_thread(source_path.exists)
-        if not exists:
-            yield RunnerProgress(
-                stage="error",
-                message=f"Source path does not exist: {source_path}",
-            )
-            return
-
-        is_dir = await asyncio.to_thread(source_path.is_dir)
-        if not is_dir:
-            yield RunnerProgress(
-                stage="error",
-                message=f"Source path is not a directory: {source_path}",
-            )
+        # Validate and scan the source path in one executor hop
+        try:
+            resolved_source, files = await open_source_folder(source_path)
+        except (FileNotFoundError, NotADirectoryError) as e:
+            yield RunnerProgress(stage="error", message=str(e))
             return
 
         manifest_entries: list[ArtifactManifestEntry] = []
         now = datetime.now(UTC).isoformat()
 
         try:
-            # Ensure output folder exists
-            await asyncio.to_thread(output_folder.mkdir, parents=True, exist_ok=True)
+            # Create the output folder and its subdirectories in one executor hop
+            await asyncio.to_thread(_make_output_dirs, output_folder, resolved_source, files)
 
             # Initialize index counter
             counter = IndexCounter(
@@ -183,9 +311,6 @@ class FolderCollector:
                 mode=naming_config.numbering_mode,
             )
 
-            # Scan files safely
-            resolved_source = await asyncio.to_thread(source_path.resolve)
-            files = await scan_files_safe(source_path)
             total = len(files)
 
             yield RunnerProgress(
@@ -203,33 +328,40 @@ class FolderCollector:
                 )
                 return
 
-            # Process files
-            artifacts_collected = 0
-            for i, item in enumerate(files):
-                try:
-                    result = await self._process_file(
-                        item,
-                        resolved_source,
-                        output_folder,
-                        counter,
-                        naming_config,
-                        now,
-                    )
-                    if result:
-                        _, entry = result
-                        manifest_entries.append(entry)
-                        artifacts_collected += 1
-                except Exception as e:
-                    logger.warning(f"Failed to process {item}: {e}")
-
-                progress = 30 + int((i + 1) / total * 65)
-                if i % 10 == 0:  # Update every 10 files
-                    yield RunnerProgress(
-                        stage="processing",
-                        message=f"Processed {i + 1}/{total} files",
-                        percent=progress,
-                    )
-                await asyncio.sleep(0)  # Yield control
+            # Process files, reporting progress in completion order
+            tasks = self._start_file_tasks(
+                files, resolved_source, output_folder, counter, naming_config, now
+            )
+            started = last_progress = time.monotonic()
+            try:
+                for i, next_done in enumerate(asyncio.as_completed(tasks)):
+                    try:
+                        await next_done
+                    except Exception as e:
+                        logger.warning(f"Failed to process file: {e}")
+
+                    # Report at most every PROGRESS_INTERVAL_SECONDS (and on the
+                    # last file), however fast files complete
+                    current = time.monotonic()
+                    if current - last_progress >= PROGRESS_INTERVAL_SECONDS or i == total - 1:
+                        last_progress = current
+                        rate = (i + 1) / max(current - started, 1e-3)
+                        yield RunnerProgress(
+                            stage="processing",
+                            message=f"Processed {i + 1}/{total} files ({rate:.0f} files/s)",
+                            percent=30 + int((i + 1) / total * 65),
+                        )
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+            # Keep manifest entries in scan order
+            for task in tasks:
+                result = None if task.exception() else task.result()
+                if result:
+                    _, entry = result
+                    manifest_entries.append(entry)
+            artifacts_collected = len(manifest_entries)
 
             # Save manifest with resolved source path for consistency
             await self._save_manifest(
@@ -245,12 +377,46 @@ class FolderCollector:
         except Exception as e:
             yield RunnerProgress(stage="error", message=str(e))
 
+    def _start_file_tasks(
+        self,
+        files: list[Path],
+        resolved_source: Path,
+        output_folder: Path,
+        counter: IndexCounter,
+        naming_config: NamingConfig,
+        timestamp: str,
+    ) -> list["asyncio.Task[tuple[ArtifactRef, ArtifactManifestEntry] | None]"]:
+        """
+        Schedule file processing, bounded by max_concurrent_files.
+
+        Indices are assigned up front in scan order so generated filenames do
+        not depend on which copy finishes first.
+
+        Returns:
+            One task per file, in the order of files
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_files)
+        source_key = str(resolved_source)
+
+        async def _guarded(
+            item: Path, index: int
+        ) -> tuple[ArtifactRef, ArtifactManifestEntry] | None:
+            async with semaphore:
+                return await self._process_file(
+                    item, resolved_source, output_folder, index, naming_config, timestamp
+                )
+
+        return [
+            asyncio.create_task(_guarded(item, counter.next(source_key=source_key)))
+            for item in files
+        ]
+
     async def _process_file(
         self,
         item: Path,
         resolved_source: Path,
         output_folder: Path,
-        counter: IndexCounter,
+        index: int,
         naming_config: NamingConfig,
         timestamp: str,
     ) -> tuple[ArtifactRef, ArtifactManifestEntry] | None:
@@ -261,39 +427,32 @@ class FolderCollector:
             Tuple of (ArtifactRef, ArtifactManifestEntry) or None if failed
         """
         try:
-            # Compute content hash using streaming (memory-efficient for large files)
-            content_hash = await asyncio.to_thread(compute_content_hash_streaming, item)
-
             # Get file metadata
             ext = item.suffix.lower()
             artifact_type = get_artifact_type(ext)
-            mime_type, _ = mimetypes.guess_type(str(item))
-            file_size = await asyncio.to_thread(lambda: item.stat().st_size)
-
-            # Build context for filename generation
-            context = {
-                "source_path": str(resolved_source),
-                "filename_stem": item.stem,
-                "content_hash": content_hash,
-                "timestamp": timestamp,
-                "folder_name": resolved_source.name,
-            }
-
-            # Generate filename using naming config
-            index = counter.next(source_key=str(resolved_source))
-            filename = generate_filename(naming_config, context, index, ext)
-
-            # Preserve relative directory structure in output
-            rel_path = item.relative_to(resolved_source)
-            dest_dir = output_folder / rel_path.parent
-            await asyncio.to_thread(dest_dir.mkdir, parents=True, exist_ok=True)
+            mime_type = _guess_mime_type(item, ext)
+
+            def _filename_for_hash(content_hash: str) -> str:
+                # Build context for filename generation
+                context = {
+                    "source_path": str(resolved_source),
+                    "filename_stem": item.stem,
+                    "content_hash": content_hash,
+                    "timestamp": timestamp,
+                    "folder_name": resolved_source.name,
+                }
+                return generate_filename(naming_config, context, index, ext)
 
             # For folder collection, we preserve original name in directory structure
             # but use generated name for the file itself
-            dest_path = dest_dir / filename
+            rel_path = item.relative_to(resolved_source)
+            dest_dir = output_folder / rel_path.parent
 
-            # Copy file
-            await asyncio.to_thread(shutil.copy2, item, dest_path)
+            # Copy and hash in a single read pass and executor hop
+            content_hash, file_size, dest_path = await asyncio.to_thread(
+                _copy_file, item, dest_dir, _filename_for_hash, self.copy_mode
+            )
+            filename = dest_path.name
 
             # Generate persistent ID from pre-computed hash
             artifact_id = generate_persistent_id_from_hash(content_hash, str(item), timestamp)
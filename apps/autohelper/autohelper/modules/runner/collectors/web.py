@@ -5,24 +5,38 @@ Collects artifacts from web pages with SSRF protection and manifest tracking.
 """
 
 import asyncio
+import hashlib
+import importlib.util
 import logging
-import mimetypes
-import threading
+import math
+import os
+import struct
+import tempfile
 import uuid
 from collections.abc import AsyncIterator
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-from bs4 import BeautifulSoup
+import httpx
+
+try:
+    from bs4 import BeautifulSoup
+except ImportError as e:
+    raise ImportError(
+        "beautifulsoup4 is required for web collection. "
+        "Install with: pip install beautifulsoup4 lxml"
+    ) from e
+from PIL import Image
 
 from ..adapters import AdapterRegistry
 from ..naming import (
     IndexCounter,
-    compute_content_hash,
     compute_url_hash,
     generate_filename,
-    generate_persistent_id,
+    generate_persistent_id_from_hash,
+    new_content_hasher,
 )
 from ..ssrf import SSRFProtectedClient, is_safe_url
 from ..types import (
@@ -34,43 +48,216 @@ from ..types import (
     RunnerProgress,
     RunnerResult,
 )
-from .base import MAX_IMAGES, REQUEST_TIMEOUT
+from .base import MAX_CONCURRENT_DOWNLOADS, MAX_IMAGES, REQUEST_TIMEOUT
 
 logger = logging.getLogger(__name__)
 
-# Lazy imports for optional dependencies
-_bs4: type[BeautifulSoup] | None = None
-_bs4_lock = threading.Lock()
+# Read size for streamed download bodies
+DOWNLOAD_CHUNK_SIZE = 65536
+
+# Bytes of an image body searched for its dimensions while it downloads
+IMAGE_HEADER_PROBE_BYTES = 262144
+
+# File extension per image content-type; anything else is saved as .jpg
+_IMAGE_EXTENSIONS = {
+    "image/jpeg": ".jpg",
+    "image/pjpeg": ".jpg",
+    "image/png": ".png",
+    "image/apng": ".apng",
+    "image/gif": ".gif",
+    "image/webp": ".webp",
+    "image/avif": ".avif",
+    "image/bmp": ".bmp",
+    "image/tiff": ".tiff",
+    "image/svg+xml": ".svg",
+    "image/x-icon": ".ico",
+    "image/vnd.microsoft.icon": ".ico",
+    "image/heic": ".heic",
+    "image/heif": ".heif",
+    "image/jxl": ".jxl",
+}
+
+# Best available HTML parser, detected once at import
+if importlib.util.find_spec("lxml") is not None:
+    _HTML_PARSER = "lxml"
+else:
+    logger.info("lxml not available, falling back to html.parser")
+    _HTML_PARSER = "html.parser"
+
+
+def _read_image_size(path: Path) -> tuple[int, int]:
+    """Read image dimensions from the file header."""
+    with Image.open(path) as img:
+        return img.size
+
+
+# JPEG start-of-frame markers, which carry the image dimensions
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _jpeg_size(head: bytes | bytearray) -> tuple[int, int] | None:
+    """Walk JPEG marker segments to the start-of-frame header."""
+    i = 2
+    while i + 9 <= len(head):
+        if head[i] != 0xFF:
+            return None
+        marker = head[i + 1]
+        if marker == 0xFF:
+            # Fill byte before a marker
+            i += 1
+        elif marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            # Standalone markers have no length field
+            i += 2
+        elif marker in _JPEG_SOF_MARKERS:
+            height, width = struct.unpack_from(">HH", head, i + 5)
+            return width, height
+        else:
+            i += 2 + struct.unpack_from(">H", head, i + 2)[0]
+    return None
+
+
+def _probe_image_size(head: bytes | bytearray) -> tuple[int, int] | None:
+    """
+    Read image dimensions from the first bytes of a download, if they suffice.
 
+    Parses JPEG, PNG, GIF and WebP headers directly; other formats return
+    None and are measured with Pillow once fully downloaded.
+    """
+    if head[:8] == b"\x89PNG\r\n\x1a\n":
+        if len(head) >= 24 and head[12:16] == b"IHDR":
+            return struct.unpack_from(">II", head, 16)
+    elif head[:6] in (b"GIF87a", b"GIF89a"):
+        if len(head) >= 10:
+            return struct.unpack_from("<HH", head, 6)
+    elif head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        chunk = head[12:16]
+        if chunk == b"VP8 " and len(head) >= 30 and head[23:26] == b"\x9d\x01\x2a":
+            width, height = struct.unpack_from("<HH", head, 26)
+            return width & 0x3FFF, height & 0x3FFF
+        if chunk == b"VP8L" and len(head) >= 25 and head[20] == 0x2F:
+            bits = int.from_bytes(head[21:25], "little")
+            return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+        if chunk == b"VP8X" and len(head) >= 30:
+            width = int.from_bytes(head[24:27], "little") + 1
+            height = int.from_bytes(head[27:30], "little") + 1
+            return width, height
+    elif head[:2] == b"\xff\xd8":
+        return _jpeg_size(head)
+    return None
+
+
+# Query parameters ignored when comparing image URLs: ones that only select
+# a rendition of the same image, and cache-busting version/token parameters.
+# Page URLs keep them, since e.g. ?t= or ?v= can name distinct pages.
+_IMAGE_VARIANT_QUERY_PARAMS = frozenset({"w", "h", "fit", "v", "cb", "_", "t", "token"})
+
+# Variant parameters that request a rendition size
+_IMAGE_SIZE_QUERY_PARAMS = frozenset({"w", "h"})
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _current_umask() -> int:
+    """Read the process umask (os.umask can only be read by setting it)."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Mode for saved downloads: mkstemp creates files 0600, but collected files
+# should get the permissions a plain open() would have given them
+_SAVED_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def _canonical_url(url: str, ignored_params: frozenset[str] = frozenset()) -> str:
+    """
+    Key for recognising URLs that point at the same resource.
 
-def _get_bs4() -> type[BeautifulSoup]:
-    """Lazy import BeautifulSoup (thread-safe)."""
-    global _bs4
-    if _bs4 is None:
-        with _bs4_lock:
-            # Double-check after acquiring lock
-            if _bs4 is None:
-                try:
-                    from bs4 import BeautifulSoup as BS4Class
+    Lowercases scheme and host, drops default ports, fragments, trailing
+    slashes and any ignored_params query parameters, and sorts the query.
+    """
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if ":" in host:
+        host = f"[{host}]"
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in ignored_params
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def _dedupe_urls(urls: list[str]) -> list[str]:
+    """Drop URLs whose canonical form was already seen, keeping first occurrences."""
+    seen: set[str] = set()
+    unique: list[str] = []
+    for url in urls:
+        key = _canonical_url(url)
+        if key not in seen:
+            seen.add(key)
+            unique.append(url)
+    return unique
+
+
+def _variant_size(url: str) -> float:
+    """Largest w/h query value of an image URL; infinite for an unsized original."""
+    try:
+        query = urlsplit(url).query
+    except ValueError:
+        return math.inf
+    sizes = [
+        int(value)
+        for key, value in parse_qsl(query)
+        if key in _IMAGE_SIZE_QUERY_PARAMS and value.isdigit()
+    ]
+    return max(sizes, default=math.inf)
+
+
+def _dedupe_image_urls(urls: list[str]) -> list[str]:
+    """
+    Collapse variants of the same image, keeping the largest rendition of each.
 
-                    _bs4 = BS4Class
-                except ImportError as e:
-                    raise ImportError(
-                        "beautifulsoup4 is required for web collection. "
-                        "Install with: pip install beautifulsoup4 lxml"
-                    ) from e
-    return _bs4
+    Each image stays at the position where one of its variants first appeared,
+    so a thumbnail listed before the full-size URL does not replace it (and
+    then fail the min_width/min_height checks).
+    """
+    best: dict[str, str] = {}
+    for url in urls:
+        key = _canonical_url(url, _IMAGE_VARIANT_QUERY_PARAMS)
+        kept = best.get(key)
+        if kept is None or _variant_size(url) > _variant_size(kept):
+            best[key] = url
+    return list(best.values())
 
 
-def _get_html_parser() -> str:
-    """Determine the best available HTML parser, with fallback."""
-    try:
-        import lxml  # noqa: F401
+def _page_fingerprint(body: bytes) -> bytes:
+    """Digest identifying a page body, used to skip pages that were already parsed."""
+    return hashlib.blake2b(body, digest_size=16).digest()
 
-        return "lxml"
-    except ImportError:
-        logger.info("lxml not available, falling back to html.parser")
-        return "html.parser"
+
+async def _discard_unsaved_downloads(tasks: list["asyncio.Task[Any]"]) -> None:
+    """
+    Cancel unfinished download tasks and delete temporary files never moved into place.
+
+    Each task returns a tuple starting with its temporary path, or None. Tasks are
+    awaited so interrupted downloads remove their own partial files; paths of
+    saved downloads were already renamed, so unlinking them is a no-op.
+    """
+    for task in tasks:
+        task.cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    leftovers = [result[0] for result in results if isinstance(result, tuple)]
+    for tmp_path in leftovers:
+        await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
 
 
 class WebCollector:
@@ -91,6 +278,7 @@ class WebCollector:
         max_height: int = 5000,
         min_filesize_kb: int = 100,
         max_filesize_kb: int = 12000,
+        max_concurrent_downloads: int = MAX_CONCURRENT_DOWNLOADS,
     ):
         """
         Initialize the web collector.
@@ -104,9 +292,11 @@ class WebCollector:
             max_height: Maximum image height in pixels
             min_filesize_kb: Minimum file size in KB
             max_filesize_kb: Maximum file size in KB
+            max_concurrent_downloads: Maximum image downloads in flight at once
         """
         self.timeout = timeout
         self.max_images = max(1, max_images)
+        self.max_concurrent_downloads = max(1, max_concurrent_downloads)
 
         # Validate and normalize dimension ranges
         min_width = max(0, min_width)
@@ -161,10 +351,10 @@ class WebCollector:
                 error=f"URL validation failed: {error_msg}",
             )
 
-        BS4 = _get_bs4()
         artifacts: list[ArtifactRef] = []
         manifest_entries: list[ArtifactManifestEntry] = []
         now = datetime.now(UTC).isoformat()
+        client = SSRFProtectedClient(timeout=self.timeout)
 
         try:
             # Ensure output folder exists
@@ -177,13 +367,12 @@ class WebCollector:
             )
 
             # Fetch the page
-            client = SSRFProtectedClient(timeout=self.timeout)
             response = await client.get(source)
             response.raise_for_status()
             html = response.text
 
-            # Parse HTML
-            soup = BS4(html, _get_html_parser())
+            # Parse HTML off the event loop
+            soup = await asyncio.to_thread(BeautifulSoup, html, _HTML_PARSER)
 
             # Detect site type and get appropriate adapter
             adapter, match = AdapterRegistry.detect(source, html)
@@ -194,10 +383,9 @@ class WebCollector:
             if bio_text:
                 bio_path = output_folder / "bio.txt"
                 await asyncio.to_thread(bio_path.write_text, bio_text, encoding="utf-8")
-                bio_ref_id = await asyncio.to_thread(lambda: str(uuid.uuid4()))
                 artifacts.append(
                     ArtifactRef(
-                        ref_id=bio_ref_id,
+                        ref_id=str(uuid.uuid4()),
                         path=str(bio_path),
                         artifact_type="text",
                         mime_type="text/plain",
@@ -215,47 +403,36 @@ class WebCollector:
 
             # Extract sub-pages (for multi-page sites like Cargo)
             all_pages: list[tuple[str, BeautifulSoup]] = [(source, soup)]
-            page_urls = await adapter.extract_pages(soup, source)
+            page_urls = _dedupe_urls(await adapter.extract_pages(soup, source))
 
-            for page_url in page_urls[:10]:  # Limit sub-pages
-                try:
-                    is_page_safe, _ = await is_safe_url(page_url)
-                    if not is_page_safe:
-                        continue
-                    page_response = await client.get(page_url)
-                    page_response.raise_for_status()
-                    page_soup = BS4(page_response.text, _get_html_parser())
-                    all_pages.append((page_url, page_soup))
-                except Exception as e:
-                    logger.warning(f"Failed to fetch sub-page {page_url}: {e}")
+            all_pages.extend(
+                await self._fetch_pages(client, page_urls[:10], response.content)
+            )  # Limit sub-pages
 
-            # Extract images from all pages using adapter
-            image_urls: list[str] = []
-            for page_url, page_soup in all_pages:
-                page_images = await adapter.extract_images(page_soup, page_url)
-                image_urls.extend(page_images)
+            # Extract images from all pages using adapter. The cap is applied only
+            # after deduplication, so variants of one image cannot use up max_images
+            image_urls = await adapter.extract_images_multi(all_pages)
 
-            # Deduplicate while preserving order
-            image_urls = list(dict.fromkeys(image_urls))
+            # Deduplicate URL variants while preserving order
+            image_urls = _dedupe_image_urls(image_urls)
             logger.info(f"Found {len(image_urls)} images across {len(all_pages)} pages")
 
-            for img_url in image_urls[: self.max_images]:
-                result = await self._download_image(
-                    img_url,
-                    output_folder,
-                    counter,
-                    naming_config,
-                    source,
-                    now,
-                )
-                if result:
-                    artifact, entry = result
+            image_urls = image_urls[: self.max_images]
+            tasks = self._start_image_downloads(client, image_urls, output_folder)
+            try:
+                downloads = await asyncio.gather(*tasks)
+                for artifact, entry in await self._save_images(
+                    image_urls, downloads, output_folder, counter, naming_config, source, now
+                ):
                     artifacts.append(artifact)
                     manifest_entries.append(entry)
+            finally:
+                await _discard_unsaved_downloads(tasks)
 
             # Download CV/resume PDFs
             if extracted_metadata.cv_links:
                 cv_results = await self._download_cv_pdfs(
+                    client,
                     extracted_metadata.cv_links,
                     output_folder,
                     counter,
@@ -276,6 +453,8 @@ class WebCollector:
         except Exception as e:
             logger.exception(f"Web collection failed for {source}")
             return RunnerResult(success=False, error=str(e), artifacts=artifacts)
+        finally:
+            await client.aclose()
 
     async def collect_stream(
         self,
@@ -302,9 +481,9 @@ class WebCollector:
             yield RunnerProgress(stage="error", message=f"URL validation failed: {error_msg}")
             return
 
-        BS4 = _get_bs4()
         manifest_entries: list[ArtifactManifestEntry] = []
         now = datetime.now(UTC).isoformat()
+        client = SSRFProtectedClient(timeout=self.timeout)
 
         yield RunnerProgress(stage="connecting", message=f"Fetching {source}...", percent=5)
 
@@ -318,14 +497,13 @@ class WebCollector:
             )
 
             # Fetch the page
-            client = SSRFProtectedClient(timeout=self.timeout)
             response = await client.get(source)
             response.raise_for_status()
             html = response.text
 
             yield RunnerProgress(stage="parsing", message="Parsing page content...", percent=15)
 
-            soup = BS4(html, _get_html_parser())
+            soup = await asyncio.to_thread(BeautifulSoup, html, _HTML_PARSER)
 
             # Detect site type and get appropriate adapter
             adapter, match = AdapterRegistry.detect(source, html)
@@ -365,7 +543,7 @@ class WebCollector:
 
             # Extract sub-pages (for multi-page sites)
             all_pages: list[tuple[str, BeautifulSoup]] = [(source, soup)]
-            page_urls = await adapter.extract_pages(soup, source)
+            page_urls = _dedupe_urls(await adapter.extract_pages(soup, source))
 
             if page_urls:
                 yield RunnerProgress(
@@ -374,26 +552,16 @@ class WebCollector:
                     percent=28,
                 )
 
-            for page_url in page_urls[:10]:  # Limit sub-pages
-                try:
-                    is_page_safe, _ = await is_safe_url(page_url)
-                    if not is_page_safe:
-                        continue
-                    page_response = await client.get(page_url)
-                    page_response.raise_for_status()
-                    page_soup = BS4(page_response.text, _get_html_parser())
-                    all_pages.append((page_url, page_soup))
-                except Exception as e:
-                    logger.warning(f"Failed to fetch sub-page {page_url}: {e}")
+            all_pages.extend(
+                await self._fetch_pages(client, page_urls[:10], response.content)
+            )  # Limit sub-pages
 
-            # Extract images from all pages using adapter
-            image_urls: list[str] = []
-            for page_url, page_soup in all_pages:
-                page_images = await adapter.extract_images(page_soup, page_url)
-                image_urls.extend(page_images)
+            # Extract images from all pages using adapter. The cap is applied only
+            # after deduplication, so variants of one image cannot use up max_images
+            image_urls = await adapter.extract_images_multi(all_pages)
 
-            # Deduplicate while preserving order
-            image_urls = list(dict.fromkeys(image_urls))
+            # Deduplicate URL variants while preserving order
+            image_urls = _dedupe_image_urls(image_urls)
             total_images = min(len(image_urls), self.max_images)
 
             yield RunnerProgress(
@@ -404,28 +572,36 @@ class WebCollector:
 
             # Download images with progress
             if total_images > 0:
-                for i, img_url in enumerate(image_urls[: self.max_images]):
-                    try:
-                        result = await self._download_image(
-                            img_url,
-                            output_folder,
-                            counter,
-                            naming_config,
-                            source,
-                            now,
-                        )
-                        if result:
-                            _, entry = result
-                            manifest_entries.append(entry)
+                image_urls = image_urls[: self.max_images]
+                tasks = self._start_image_downloads(client, image_urls, output_folder)
+                # Percent reported after each completed download, in integer math
+                progress_pct = [
+                    35 + (done * 55) // total_images for done in range(total_images + 1)
+                ]
+                try:
+                    # Report progress in completion order
+                    for i, next_done in enumerate(asyncio.as_completed(tasks)):
+                        try:
+                            await next_done
+                        except Exception as e:
+                            logger.warning(f"Failed to download image: {e}")
+                            continue
 
-                        progress = 35 + int((i + 1) / total_images * 55)
                         yield RunnerProgress(
                             stage="downloading",
                             message=f"Downloaded image {i + 1}/{total_images}",
-                            percent=progress,
+                            percent=progress_pct[i + 1],
                         )
-                    except Exception as e:
-                        logger.warning(f"Failed to download {img_url}: {e}")
+
+                    # Name and record images in page order, whatever order they finished in
+                    downloads = [None if task.exception() else task.result() for task in tasks]
+                    for _, entry in await self._save_images(
+                        image_urls, downloads, output_folder, counter, naming_config, source, now
+                    ):
+                        manifest_entries.append(entry)
+                finally:
+                    # Also runs when the consumer closes the stream mid-download
+                    await _discard_unsaved_downloads(tasks)
 
             # Download CV/resume PDFs
             if extracted_metadata.cv_links:
@@ -435,6 +611,7 @@ class WebCollector:
                     percent=92,
                 )
                 cv_results = await self._download_cv_pdfs(
+                    client,
                     extracted_metadata.cv_links,
                     output_folder,
                     counter,
@@ -453,124 +630,306 @@ class WebCollector:
 
         except Exception as e:
             yield RunnerProgress(stage="error", message=str(e))
+        finally:
+            await client.aclose()
 
-    async def _download_image(
+    async def _fetch_pages(
+        self, client: SSRFProtectedClient, page_urls: list[str], source_body: bytes
+    ) -> list[tuple[str, BeautifulSoup]]:
+        """
+        Fetch and parse sub-pages concurrently, bounded by max_concurrent_downloads.
+
+        Pages whose body is identical to the source page or to an earlier sub-page
+        (e.g. several links redirecting to the same page) are skipped before parsing.
+
+        Returns:
+            (url, soup) for each distinct page fetched successfully, in the order of page_urls
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
+
+        async def _fetch(page_url: str) -> httpx.Response | None:
+            try:
+                is_page_safe, _ = await client.check_url(page_url)
+                if not is_page_safe:
+                    return None
+                async with semaphore:
+                    page_response = await client.get(page_url)
+                page_response.raise_for_status()
+                return page_response
+            except Exception as e:
+                logger.warning(f"Failed to fetch sub-page {page_url}: {e}")
+                return None
+
+        responses = await asyncio.gather(*(_fetch(page_url) for page_url in page_urls))
+
+        seen_pages = {_page_fingerprint(source_body)}
+        unique: list[tuple[str, httpx.Response]] = []
+        for page_url, page_response in zip(page_urls, responses, strict=True):
+            if page_response is None:
+                continue
+            fingerprint = _page_fingerprint(page_response.content)
+            if fingerprint in seen_pages:
+                logger.debug(f"Skipping duplicate sub-page {page_url}")
+                continue
+            seen_pages.add(fingerprint)
+            unique.append((page_url, page_response))
+
+        soups = await asyncio.gather(
+            *(
+                asyncio.to_thread(BeautifulSoup, page_response.text, _HTML_PARSER)
+                for _, page_response in unique
+            )
+        )
+        return [(page_url, soup) for (page_url, _), soup in zip(unique, soups, strict=True)]
+
+    def _start_image_downloads(
         self,
-        url: str,
+        client: SSRFProtectedClient,
+        image_urls: list[str],
+        output_folder: Path,
+    ) -> list["asyncio.Task[tuple[Path, str, int, str] | None]"]:
+        """
+        Schedule image downloads, bounded by max_concurrent_downloads.
+
+        Returns:
+            One task per URL, in the order of image_urls
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
+
+        async def _guarded(url: str) -> tuple[Path, str, int, str] | None:
+            async with semaphore:
+                return await self._download_image(client, url, output_folder)
+
+        return [asyncio.create_task(_guarded(url)) for url in image_urls]
+
+    async def _save_images(
+        self,
+        image_urls: list[str],
+        downloads: list[tuple[Path, str, int, str] | None],
         output_folder: Path,
         counter: IndexCounter,
         naming_config: NamingConfig,
         source_url: str,
         timestamp: str,
-    ) -> tuple[ArtifactRef, ArtifactManifestEntry] | None:
+    ) -> list[tuple[ArtifactRef, ArtifactManifestEntry]]:
         """
-        Download a single image with naming and manifest entry creation.
+        Name downloaded images and create manifest entries, in image_urls order.
+
+        Indices follow page order rather than download completion, so the
+        same page always yields the same filenames.
 
         Returns:
-            Tuple of (ArtifactRef, ArtifactManifestEntry) or None if failed
+            List of (ArtifactRef, ArtifactManifestEntry) tuples
         """
-        # Validate URL for SSRF protection
-        is_safe, error_msg = await is_safe_url(url)
+        results: list[tuple[ArtifactRef, ArtifactManifestEntry]] = []
+
+        for url, download in zip(image_urls, downloads, strict=True):
+            if download is None:
+                continue
+            tmp_path, content_hash, file_size, content_type = download
+
+            try:
+                # Build context for filename generation
+                context = {
+                    "source_url": source_url,
+                    "url_hash": compute_url_hash(url),
+                    "content_hash": content_hash,
+                    "timestamp": timestamp,
+                }
+
+                # Generate filename using naming config
+                ext = _IMAGE_EXTENSIONS.get(content_type, ".jpg")
+                index = counter.next(source_key=source_url)
+                filename = generate_filename(naming_config, context, index, ext)
+                filepath = output_folder / filename
+
+                # Move the downloaded file into place
+                await asyncio.to_thread(tmp_path.replace, filepath)
+
+                # Generate persistent ID
+                artifact_id = generate_persistent_id_from_hash(content_hash, url, timestamp)
+
+                # Create artifact reference
+                artifact = ArtifactRef(
+                    ref_id=artifact_id,
+                    path=str(filepath),
+                    artifact_type="image",
+                    mime_type=content_type or "image/jpeg",
+                )
+
+                # Create manifest entry
+                entry = ArtifactManifestEntry(
+                    artifact_id=artifact_id,
+                    original_filename=filename,
+                    current_filename=filename,
+                    content_hash=content_hash,
+                    source_url=url,
+                    collected_at=timestamp,
+                    mime_type=content_type or "image/jpeg",
+                    size=file_size,
+                    metadata={
+                        "source_page": source_url,
+                        "url_hash": context["url_hash"],
+                    },
+                )
+
+                results.append((artifact, entry))
+
+            except Exception as e:
+                logger.warning(f"Failed to save image {url}: {e}")
+                await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
+
+        return results
+
+    async def _rejected_by_head(self, client: SSRFProtectedClient, url: str) -> bool:
+        """
+        Check a HEAD response's Content-Type and Content-Length.
+
+        Rejects non-image types and sizes above max_filesize_kb. Returns False
+        whenever a header is missing or HEAD is unsupported or fails; the
+        streamed download checks both again then.
+        """
+        try:
+            response = await client.head(url)
+        except Exception as e:
+            logger.debug(f"HEAD pre-check failed for {url}: {e}")
+            return False
+        if not response.is_success:
+            return False
+        content_type = response.headers.get("content-type", "")
+        content_type_base = content_type.partition(";")[0].strip().lower()
+        if content_type_base and not content_type_base.startswith("image/"):
+            logger.warning(f"Skipping non-image content-type {content_type_base} from {url}")
+            return True
+        try:
+            size = int(response.headers.get("content-length", ""))
+        except ValueError:
+            return False
+        if size > self.max_filesize_bytes:
+            logger.debug(
+                f"Skipping image {url}: HEAD Content-Length {size} > max {self.max_filesize_bytes}"
+            )
+            return True
+        return False
+
+    def _dimensions_ok(self, url: str, width: int, height: int) -> bool:
+        """Check image dimensions against the configured bounds."""
+        if width < self.min_width or width > self.max_width:
+            logger.debug(
+                f"Skipping image {url}: width {width} outside [{self.min_width}, {self.max_width}]"
+            )
+            return False
+        if height < self.min_height or height > self.max_height:
+            logger.debug(
+                f"Skipping image {url}: height {height} "
+                f"outside [{self.min_height}, {self.max_height}]"
+            )
+            return False
+        return True
+
+    async def _download_image(
+        self, client: SSRFProtectedClient, url: str, output_folder: Path
+    ) -> tuple[Path, str, int, str] | None:
+        """
+        Stream a single image to a temporary file in output_folder.
+
+        Returns:
+            Tuple of (temporary path, content hash, size, content-type), or
+            None if the URL is unsafe, the request fails, or the image is
+            outside the configured size or dimension bounds
+        """
+        # Validate URL for SSRF protection (once per host per collection)
+        is_safe, error_msg = await client.check_url(url)
         if not is_safe:
             logger.warning(f"Skipping unsafe image URL {url}: {error_msg}")
             return None
 
+        tmp_path: Path | None = None
         try:
-            client = SSRFProtectedClient(timeout=self.timeout)
-            response = await client.get(url)
-            response.raise_for_status()
-
-            # Check Content-Length header before processing (memory protection)
-            content_length = response.headers.get("content-length")
-            if content_length:
-                try:
-                    size = int(content_length)
-                    if size > self.max_filesize_bytes:
-                        logger.debug(f"Skipping image {url}: Content-Length {size} > max {self.max_filesize_bytes}")
-                        return None
-                except ValueError:
-                    pass  # Invalid Content-Length header, continue with download
+            # Reject non-image or oversized responses from HEAD before any body is sent
+            if await self._rejected_by_head(client, url):
+                return None
 
-            content = response.content
+            async with client.stream(url) as response:
+                response.raise_for_status()
 
-            # Validate content-type
-            content_type = response.headers.get("content-type", "")
-            content_type_base = content_type.split(";")[0].strip().lower()
-            if not content_type_base.startswith("image/"):
-                logger.warning(f"Skipping non-image content-type {content_type_base} from {url}")
-                return None
+                # Check Content-Length header before reading the body (memory protection)
+                content_length = response.headers.get("content-length")
+                if content_length:
+                    try:
+                        size = int(content_length)
+                        if size > self.max_filesize_bytes:
+                            logger.debug(f"Skipping image {url}: Content-Length {size} > max {self.max_filesize_bytes}")
+                            return None
+                        # An encoded body's length says nothing about the decoded size
+                        if (
+                            size < self.min_filesize_bytes
+                            and "content-encoding" not in response.headers
+                        ):
+                            logger.debug(
+                                f"Skipping image {url}: Content-Length {size} "
+                                f"< min {self.min_filesize_bytes}"
+                            )
+                            return None
+                    except ValueError:
+                        pass  # Invalid Content-Length header, continue with download
 
-            ext = mimetypes.guess_extension(content_type_base) or ".jpg"
+                # Validate content-type
+                content_type = response.headers.get("content-type", "")
+                content_type_base = content_type.partition(";")[0].strip().lower()
+                if not content_type_base.startswith("image/"):
+                    logger.warning(f"Skipping non-image content-type {content_type_base} from {url}")
+                    return None
+
+                # Stream the body to a temporary file, hashing as it arrives,
+                # so at most one chunk per download is held in memory
+                fd, tmp_name = await asyncio.to_thread(
+                    tempfile.mkstemp, suffix=".part", dir=output_folder
+                )
+                tmp_path = Path(tmp_name)
+                hasher = new_content_hasher()
+                file_size = 0
+                # Dimensions parsed from the leading bytes let out-of-bounds
+                # images be dropped before the rest of the body is fetched
+                head = bytearray()
+                dimensions: tuple[int, int] | None = None
+                with os.fdopen(fd, "wb") as f:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        file_size += len(chunk)
+                        if file_size > self.max_filesize_bytes:
+                            logger.debug(
+                                f"Skipping image {url}: size exceeds max {self.max_filesize_bytes}"
+                            )
+                            return None
+                        if dimensions is None and len(head) < IMAGE_HEADER_PROBE_BYTES:
+                            head += chunk
+                            dimensions = _probe_image_size(head)
+                            if dimensions is not None and not self._dimensions_ok(
+                                url, *dimensions
+                            ):
+                                return None
+                        hasher.update(chunk)
+                        await asyncio.to_thread(f.write, chunk)
 
             # Check filesize bounds
-            file_size = len(content)
             if file_size < self.min_filesize_bytes:
                 logger.debug(f"Skipping image {url}: size {file_size} < min {self.min_filesize_bytes}")
                 return None
-            if file_size > self.max_filesize_bytes:
-                logger.debug(f"Skipping image {url}: size {file_size} > max {self.max_filesize_bytes}")
-                return None
 
-            # Check image dimensions
-            try:
-                from PIL import Image
-                import io
-                with Image.open(io.BytesIO(content)) as img:
-                    width, height = img.size
-                    if width < self.min_width or width > self.max_width:
-                        logger.debug(f"Skipping image {url}: width {width} outside [{self.min_width}, {self.max_width}]")
-                        return None
-                    if height < self.min_height or height > self.max_height:
-                        logger.debug(f"Skipping image {url}: height {height} outside [{self.min_height}, {self.max_height}]")
+            # Check image dimensions, unless already checked while downloading
+            if dimensions is None:
+                try:
+                    width, height = await asyncio.to_thread(_read_image_size, tmp_path)
+                    if not self._dimensions_ok(url, width, height):
                         return None
-            except Exception as e:
-                logger.warning(f"Could not read image dimensions for {url}: {e}")
-                # Continue anyway - dimension check is best-effort
-
-            # Build context for filename generation
-            context = {
-                "source_url": source_url,
-                "url_hash": compute_url_hash(url),
-                "content_hash": compute_content_hash(content),
-                "timestamp": timestamp,
-            }
-
-            # Generate filename using naming config
-            index = counter.next(source_key=source_url)
-            filename = generate_filename(naming_config, context, index, ext)
-            filepath = output_folder / filename
-
-            # Write file
-            await asyncio.to_thread(filepath.write_bytes, content)
-
-            # Generate persistent ID
-            artifact_id = generate_persistent_id(content, url, timestamp)
-
-            # Create artifact reference
-            artifact = ArtifactRef(
-                ref_id=artifact_id,
-                path=str(filepath),
-                artifact_type="image",
-                mime_type=content_type_base or "image/jpeg",
-            )
-
-            # Create manifest entry
-            entry = ArtifactManifestEntry(
-                artifact_id=artifact_id,
-                original_filename=filename,
-                current_filename=filename,
-                content_hash=context["content_hash"],
-                source_url=url,
-                collected_at=timestamp,
-                mime_type=content_type_base or "image/jpeg",
-                size=len(content),
-                metadata={
-                    "source_page": source_url,
-                    "url_hash": context["url_hash"],
-                },
-            )
+                except Exception as e:
+                    logger.warning(f"Could not read image dimensions for {url}: {e}")
+                    # Continue anyway - dimension check is best-effort
 
-            return artifact, entry
+            await asyncio.to_thread(os.chmod, tmp_path, _SAVED_FILE_MODE)
+            download = (tmp_path, hasher.hexdigest(), file_size, content_type_base)
+            tmp_path = None
+            return download
 
         except ValueError as e:
             logger.warning(f"Image URL blocked by SSRF protection {url}: {e}")
@@ -578,9 +937,13 @@ class WebCollector:
         except Exception as e:
             logger.warning(f"Failed to download image {url}: {e}")
             return None
+        finally:
+            if tmp_path is not None:
+                await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
 
     async def _download_cv_pdfs(
         self,
+        client: SSRFProtectedClient,
         cv_links: list[str],
         output_folder: Path,
         counter: IndexCounter,
@@ -591,53 +954,71 @@ class WebCollector:
         Download CV/resume PDFs and create manifest entries.
 
         Args:
+            client: Shared client for the collection
             cv_links: List of PDF URLs to download
             output_folder: Output folder for artifacts
             counter: Index counter for naming
             source_url: Source page URL
             timestamp: Collection timestamp
 
+        Returns:
+            List of (ArtifactRef, ArtifactManifestEntry) tuples
+        """
+        # Fetch concurrently, then number and save in link order
+        semaphore = asyncio.Semaphore(self.max_concurrent_downloads)
+
+        async def _guarded(url: str) -> tuple[Path, str, int] | None:
+            async with semaphore:
+                return await self._fetch_cv_pdf(client, url, output_folder)
+
+        tasks = [asyncio.create_task(_guarded(url)) for url in cv_links]
+        try:
+            downloads = await asyncio.gather(*tasks)
+            results = await self._save_cv_pdfs(
+                cv_links, downloads, output_folder, counter, source_url, timestamp
+            )
+        finally:
+            await _discard_unsaved_downloads(tasks)
+        return results
+
+    async def _save_cv_pdfs(
+        self,
+        cv_links: list[str],
+        downloads: list[tuple[Path, str, int] | None],
+        output_folder: Path,
+        counter: IndexCounter,
+        source_url: str,
+        timestamp: str,
+    ) -> list[tuple[ArtifactRef, ArtifactManifestEntry]]:
+        """
+        Name downloaded CV PDFs and create manifest entries, in cv_links order.
+
         Returns:
             List of (ArtifactRef, ArtifactManifestEntry) tuples
         """
         results: list[tuple[ArtifactRef, ArtifactManifestEntry]] = []
 
-        for url in cv_links:
-            # SSRF validation
-            is_safe, error_msg = await is_safe_url(url)
-            if not is_safe:
-                logger.warning(f"Skipping unsafe CV URL {url}: {error_msg}")
+        for url, download in zip(cv_links, downloads, strict=True):
+            if download is None:
                 continue
+            tmp_path, content_hash, file_size = download
 
             try:
-                client = SSRFProtectedClient(timeout=self.timeout)
-                response = await client.get(url)
-                response.raise_for_status()
-                content = response.content
-
-                # Validate content-type
-                content_type = response.headers.get("content-type", "")
-                content_type_base = content_type.split(";")[0].strip().lower()
-                if "pdf" not in content_type_base:
-                    logger.warning(f"Skipping non-PDF content-type {content_type_base} from {url}")
-                    continue
-
                 # Generate filename (cv_001.pdf, cv_002.pdf, etc.)
                 index = counter.next(source_key="cv")
                 filename = f"cv_{index:03d}.pdf"
                 filepath = output_folder / filename
 
-                # Write file
-                await asyncio.to_thread(filepath.write_bytes, content)
+                # Move the downloaded file into place
+                await asyncio.to_thread(tmp_path.replace, filepath)
 
                 # Extract text from PDF for metadata
                 from ..extractors.text import extract_pdf_text
 
                 extracted_text = await asyncio.to_thread(extract_pdf_text, filepath)
 
-                # Generate persistent ID
-                content_hash = compute_content_hash(content)
-                artifact_id = generate_persistent_id(content, url, timestamp)
+                # Generate persistent ID from the hash computed while downloading
+                artifact_id = generate_persistent_id_from_hash(content_hash, url, timestamp)
 
                 artifact = ArtifactRef(
                     ref_id=artifact_id,
@@ -654,7 +1035,7 @@ class WebCollector:
                     source_url=url,
                     collected_at=timestamp,
                     mime_type="application/pdf",
-                    size=len(content),
+                    size=file_size,
                     metadata={
                         "document_type": "cv",
                         "source_page": source_url,
@@ -666,10 +1047,64 @@ class WebCollector:
                 logger.info(f"Downloaded CV: {filename} from {url}")
 
             except Exception as e:
-                logger.warning(f"Failed to download CV {url}: {e}")
+                logger.warning(f"Failed to save CV {url}: {e}")
+                await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
 
         return results
 
+    async def _fetch_cv_pdf(
+        self, client: SSRFProtectedClient, url: str, output_folder: Path
+    ) -> tuple[Path, str, int] | None:
+        """
+        Stream a CV/resume PDF to a temporary file in output_folder.
+
+        Returns:
+            Tuple of (temporary path, content hash, size), or None if the URL
+            is unsafe, the request fails, or the response is not a PDF
+        """
+        # SSRF validation
+        is_safe, error_msg = await client.check_url(url)
+        if not is_safe:
+            logger.warning(f"Skipping unsafe CV URL {url}: {error_msg}")
+            return None
+
+        tmp_path: Path | None = None
+        try:
+            async with client.stream(url) as response:
+                response.raise_for_status()
+
+                # Validate content-type
+                content_type = response.headers.get("content-type", "")
+                content_type_base = content_type.partition(";")[0].strip().lower()
+                if "pdf" not in content_type_base:
+                    logger.warning(f"Skipping non-PDF content-type {content_type_base} from {url}")
+                    return None
+
+                # Hash as the body arrives; only one chunk is held in memory
+                fd, tmp_name = await asyncio.to_thread(
+                    tempfile.mkstemp, suffix=".part", dir=output_folder
+                )
+                tmp_path = Path(tmp_name)
+                hasher = new_content_hasher()
+                file_size = 0
+                with os.fdopen(fd, "wb") as f:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        file_size += len(chunk)
+                        hasher.update(chunk)
+                        await asyncio.to_thread(f.write, chunk)
+
+            await asyncio.to_thread(os.chmod, tmp_path, _SAVED_FILE_MODE)
+            download = (tmp_path, hasher.hexdigest(), file_size)
+            tmp_path = None
+            return download
+
+        except Exception as e:
+            logger.warning(f"Failed to download CV {url}: {e}")
+            return None
+        finally:
+            if tmp_path is not None:
+                await asyncio.to_thread(tmp_path.unlink, missing_ok=True)
+
     async def _save_manifest(
         self,
         output_folder: Path,
@@ -682,11 +1117,8 @@ class WebCollector:
         """Save collection manifest to output folder."""
         from ...storage import get_metadata_backend
 
-        # Generate UUID in thread to avoid blocking event loop on entropy reads
-        manifest_id = await asyncio.to_thread(lambda: str(uuid.uuid4()))
-
         manifest = CollectionManifest(
-            manifest_id=manifest_id,
+            manifest_id=str(uuid.uuid4()),
             created_at=timestamp,
             updated_at=timestamp,
             source_type="web",
@@ -8,6 +8,7 @@ from .bio import extract_bio_text
 from .contact import extract_emails, extract_location, extract_phones
 from .documents import extract_cv_links, extract_pdf_links
 from .images import SUPPORTED_IMAGE_EXTENSIONS, extract_image_urls
+from .links import PageLinks, extract_page_links
 from .text import extract_docx_text, extract_pdf_text
 
 __all__ = [
@@ -23,6 +24,9 @@ __all__ = [
     # Document extraction
     "extract_cv_links",
     "extract_pdf_links",
+    # Single-pass link extraction
+    "extract_page_links",
+    "PageLinks",
     # Text extraction
     "extract_pdf_text",
     "extract_docx_text",
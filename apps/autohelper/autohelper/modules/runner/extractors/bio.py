@@ -26,12 +26,18 @@ BIO_SELECTORS = [
     "main p",
 ]
 
+# All bio selectors as one selector group, matched in a single tree walk
+_BIO_SELECTOR_GROUP = ", ".join(BIO_SELECTORS)
+
 # Minimum text length to consider as substantial content
 MIN_TEXT_LENGTH = 100
 
 # Maximum number of sections to include
 MAX_SECTIONS = 5
 
+# Whitespace runs, collapsed when normalizing sections for deduplication
+_WS_RE = re.compile(r"\s+")
+
 
 def extract_bio_text(soup: "BeautifulSoup") -> str:
     """
@@ -47,23 +53,28 @@ def extract_bio_text(soup: "BeautifulSoup") -> str:
         Extracted bio text with sections separated by horizontal rules,
         or empty string if no bio content found
     """
-    text_parts = []
+    # Walk the tree once for all selectors and drop short sections up front
+    sections = []
+    for el in soup.select(_BIO_SELECTOR_GROUP):
+        text = el.get_text(separator="\n", strip=True)
+        if len(text) > MIN_TEXT_LENGTH:
+            sections.append((el, text))
 
-    for selector in BIO_SELECTORS:
-        elements = soup.select(selector)
-        for el in elements:
-            text = el.get_text(separator="\n", strip=True)
-            if len(text) > MIN_TEXT_LENGTH:
-                text_parts.append(text)
-
-    # Deduplicate while preserving order
+    # Take sections in selector priority order, deduplicating as we go and
+    # stopping as soon as MAX_SECTIONS distinct sections are collected
     seen = set()
-    unique_parts = []
-    for part in text_parts:
-        # Normalize for comparison (first 200 chars, collapsed whitespace)
-        normalized = re.sub(r"\s+", " ", part)[:200]
-        if normalized not in seen:
+    unique_parts: list[str] = []
+    for selector in BIO_SELECTORS:
+        for el, text in sections:
+            if not el.css.match(selector):
+                continue
+            # Normalize for comparison (first 200 chars, collapsed whitespace)
+            normalized = _WS_RE.sub(" ", text)[:200]
+            if normalized in seen:
+                continue
             seen.add(normalized)
-            unique_parts.append(part)
+            unique_parts.append(text)
+            if len(unique_parts) == MAX_SECTIONS:
+                return "\n\n---\n\n".join(unique_parts)
 
-    return "\n\n---\n\n".join(unique_parts[:MAX_SECTIONS])
+    return "\n\n---\n\n".join(unique_parts)
@@ -5,43 +5,8 @@ Cross-platform heuristics for email, phone, and location extraction.
 """
 
 import re
-from typing import TYPE_CHECKING, Union
-from urllib.parse import unquote
 
-from bs4 import BeautifulSoup
-from bs4.element import Tag
-
-if TYPE_CHECKING:
-    pass
-
-# Type alias for elements that support find_all and get_text
-SoupElement = Union[BeautifulSoup, Tag]
-
-
-def _get_str_attr(tag: "Tag", attr: str, default: str = "") -> str:
-    """Safely get string attribute from BS4 tag (handles list returns)."""
-    val = tag.get(attr)
-    if val is None:
-        return default
-    if isinstance(val, list):
-        return val[0] if val else default
-    return val
-
-# Email regex - conservative to avoid false positives
-EMAIL_PATTERN = re.compile(
-    r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
-    re.IGNORECASE,
-)
-
-# Phone patterns - conservative to minimize false positives
-PHONE_PATTERNS = [
-    # International format: +1 234 567 8901
-    re.compile(r"\+\d{1,3}[\s.-]?\d{2,4}[\s.-]?\d{3,4}[\s.-]?\d{3,4}"),
-    # North American: (123) 456-7890 or 123-456-7890
-    re.compile(r"\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}"),
-    # European: common formats
-    re.compile(r"\+\d{2}[\s.]?\d{2}[\s.]?\d{3}[\s.]?\d{2}[\s.]?\d{2}"),
-]
+from .links import SoupElement, extract_page_links
 
 # Location selectors - site-specific blocks
 LOCATION_SELECTORS = [
@@ -54,6 +19,9 @@ LOCATION_SELECTORS = [
     "[data-location]",
 ]
 
+# All location selectors as one selector group, matched in a single tree walk
+_LOCATION_SELECTOR_GROUP = ", ".join(LOCATION_SELECTORS)
+
 # Common city/country patterns
 CITY_COUNTRY_PATTERN = re.compile(
     r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s*,\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\b"
@@ -77,29 +45,7 @@ def extract_emails(soup: SoupElement | None) -> list[str]:
     if soup is None:
         return []
 
-    emails: list[str] = []
-
-    # 1. Extract from mailto: links
-    for link in soup.find_all("a", href=True):
-        href = _get_str_attr(link, "href")
-        if href.lower().startswith("mailto:"):
-            # Remove mailto: prefix and any query params (?subject=...)
-            mailto_content = href[7:].split("?")[0].strip()
-            mailto_content = unquote(mailto_content)  # Handle URL-encoded characters
-            # Handle display names like "John Doe" <john@example.com> and multiple recipients
-            for match in EMAIL_PATTERN.finditer(mailto_content):
-                email = match.group(0).lower()
-                if email not in emails:
-                    emails.append(email)
-
-    # 2. Scan visible text for email patterns
-    text = soup.get_text(separator=" ", strip=True)
-    for match in EMAIL_PATTERN.finditer(text):
-        email = match.group(0).lower()
-        if email not in emails:
-            emails.append(email)
-
-    return list(dict.fromkeys(emails))  # Preserve order, dedupe
+    return extract_page_links(soup, phones=False).emails
 
 
 def extract_phones(soup: SoupElement | None) -> list[str]:
@@ -119,35 +65,7 @@ def extract_phones(soup: SoupElement | None) -> list[str]:
     if soup is None:
         return []
 
-    phones: list[str] = []
-
-    # 1. Extract from tel: links
-    for link in soup.find_all("a", href=True):
-        href = _get_str_attr(link, "href")
-        if href.lower().startswith("tel:"):
-            phone = href[4:].strip()
-            phone = unquote(phone)
-            normalized = _normalize_phone(phone)
-            # Validate: must have at least 7 digits (shortest valid phone numbers)
-            if normalized and len(normalized) >= 7 and normalized not in phones:
-                phones.append(normalized)
-
-    # 2. Scan visible text for phone patterns
-    text = soup.get_text(separator=" ", strip=True)
-    for pattern in PHONE_PATTERNS:
-        for match in pattern.finditer(text):
-            phone = _normalize_phone(match.group(0))
-            if phone not in phones and len(phone) >= 10:
-                phones.append(phone)
-
-    return list(dict.fromkeys(phones))  # Preserve order, dedupe
-
-
-def _normalize_phone(phone: str) -> str:
-    """Normalize phone number to consistent format."""
-    # Remove common separators, keep + prefix
-    cleaned = re.sub(r"[\s.\-()]+", "", phone)
-    return cleaned
+    return extract_page_links(soup, emails=False).phones
 
 
 def extract_location(
@@ -179,11 +97,17 @@ def extract_location(
                     candidates.append(location)
         return (candidates[0] if candidates else None, candidates)
 
-    # 1. Check explicit location elements
+    # 1. Check explicit location elements, walking the tree once for all
+    # selectors and then bucketing matches by selector to keep priority order
+    elements = []
+    for el in soup.select(_LOCATION_SELECTOR_GROUP):
+        text = el.get_text(strip=True)
+        if text and len(text) < 100:  # Avoid grabbing entire sections
+            elements.append((el, text))
+
     for selector in LOCATION_SELECTORS:
-        for el in soup.select(selector):
-            text = el.get_text(strip=True)
-            if text and len(text) < 100:  # Avoid grabbing entire sections
+        for el, text in elements:
+            if el.css.match(selector):
                 candidates.append(text)
 
     # 2. Parse "City, Country" from bio text
@@ -4,17 +4,18 @@ Image URL extraction from HTML.
 Extracts image URLs from parsed HTML, including img tags and CSS background images.
 """
 
+import posixpath
 import re
-from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import urljoin, urlparse
 
+from bs4.element import Tag
+
 if TYPE_CHECKING:
     from bs4 import BeautifulSoup
-    from bs4.element import Tag
 
 
-def _get_str_attr(tag: "Tag", attr: str, default: str = "") -> str:
+def _get_str_attr(tag: Tag, attr: str, default: str = "") -> str:
     """Safely get string attribute from BS4 tag (handles list returns)."""
     val = tag.get(attr)
     if val is None:
@@ -26,6 +27,15 @@ def _get_str_attr(tag: "Tag", attr: str, default: str = "") -> str:
 # Supported image file extensions
 SUPPORTED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp", ".tiff"}
 
+# Style attributes that may carry a CSS background image
+_BG_STYLE_RE = re.compile(r"background.*url")
+
+# url() with double quotes, single quotes, or no quotes. Each quote type is
+# matched separately to avoid truncation issues.
+_URL_DOUBLE_QUOTED_RE = re.compile(r'url\(\s*"([^"]*)"\s*\)')
+_URL_SINGLE_QUOTED_RE = re.compile(r"url\(\s*'([^']*)'\s*\)")
+_URL_UNQUOTED_RE = re.compile(r'url\(\s*([^"\'\s)]+)\s*\)')
+
 
 def extract_image_urls(
     soup: "BeautifulSoup",
@@ -50,49 +60,53 @@ def extract_image_urls(
     if supported_extensions is None:
         supported_extensions = SUPPORTED_IMAGE_EXTENSIONS
 
-    image_urls = []
+    # Insertion-ordered dict deduplicates while collecting
+    image_urls: dict[str, None] = {}
+    # Raw attribute values already handled, so repeated sources skip
+    # urljoin and the extension check
+    seen_srcs: set[str] = set()
 
-    # Find all img tags
-    for img in soup.find_all("img"):
-        src = (
-            _get_str_attr(img, "src")
-            or _get_str_attr(img, "data-src")
-            or _get_str_attr(img, "data-lazy-src")
-        )
-        if src:
+    def _collect(src: str) -> None:
+        """Add a candidate URL if it is a new, supported image."""
+        if src not in seen_srcs:
+            seen_srcs.add(src)
             full_url = urljoin(base_url, src)
             if _is_supported_image(full_url, supported_extensions):
-                image_urls.append(full_url)
+                image_urls[full_url] = None
+
+    # Walk the tree once: img sources are collected as they are found, while
+    # background styles are deferred so img tags keep priority in the result
+    background_styles: list[str] = []
+    for el in soup.descendants:
+        if not isinstance(el, Tag):
+            continue
+        if el.name == "img":
+            src = (
+                _get_str_attr(el, "src")
+                or _get_str_attr(el, "data-src")
+                or _get_str_attr(el, "data-lazy-src")
+            )
+            if src:
+                _collect(src)
+        style = _get_str_attr(el, "style")
+        if style and _BG_STYLE_RE.search(style):
+            background_styles.append(style)
 
     # Check for background images in style attributes
     # Regex handles: url("..."), url('...'), and url(...)
-    # Uses non-greedy matching with proper delimiter awareness
-    for el in soup.find_all(style=re.compile(r"background.*url")):
-        style = _get_str_attr(el, "style")
-        # Match url() with double quotes, single quotes, or no quotes
-        # Handle each quote type separately to avoid truncation issues
-        for match in re.finditer(r'url\(\s*"([^"]*)"\s*\)', style):
-            full_url = urljoin(base_url, match.group(1))
-            if _is_supported_image(full_url, supported_extensions):
-                image_urls.append(full_url)
-        for match in re.finditer(r"url\(\s*'([^']*)'\s*\)", style):
-            full_url = urljoin(base_url, match.group(1))
-            if _is_supported_image(full_url, supported_extensions):
-                image_urls.append(full_url)
-        for match in re.finditer(r'url\(\s*([^"\'\s)]+)\s*\)', style):
-            full_url = urljoin(base_url, match.group(1))
-            if _is_supported_image(full_url, supported_extensions):
-                image_urls.append(full_url)
+    for style in background_styles:
+        for pattern in (_URL_DOUBLE_QUOTED_RE, _URL_SINGLE_QUOTED_RE, _URL_UNQUOTED_RE):
+            for match in pattern.finditer(style):
+                _collect(match.group(1))
 
-    # Deduplicate while preserving order
-    return list(dict.fromkeys(image_urls))
+    return list(image_urls)
 
 
 def _is_supported_image(url: str, supported_extensions: set[str]) -> bool:
     """Check if URL points to a supported image type by extension."""
     try:
         parsed = urlparse(url)
-        ext = Path(parsed.path).suffix.lower()
+        ext = posixpath.splitext(parsed.path.rstrip("/"))[1].lower()
         return ext in supported_extensions
     except Exception:
         return False
@@ -0,0 +1,173 @@
+"""
+Single-pass link extraction from HTML.
+
+Collects emails, phones, CV links and PDF links with one walk over the
+page's <a href> elements and one visible-text scan. The per-category
+extractors in contact and documents are thin wrappers over this pass that
+request only their own category.
+"""
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import unquote, urljoin, urlparse
+
+from bs4 import BeautifulSoup
+from bs4.element import Tag
+
+# Type alias for elements that support find_all and get_text
+SoupElement = BeautifulSoup | Tag
+
+# Email regex - conservative to avoid false positives
+EMAIL_PATTERN = re.compile(
+    r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}",
+    re.IGNORECASE,
+)
+
+# Phone patterns - conservative to minimize false positives
+PHONE_PATTERNS = [
+    # International format: +1 234 567 8901
+    re.compile(r"\+\d{1,3}[\s.-]?\d{2,4}[\s.-]?\d{3,4}[\s.-]?\d{3,4}"),
+    # North American: (123) 456-7890 or 123-456-7890
+    re.compile(r"\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}"),
+    # European: common formats
+    re.compile(r"\+\d{2}[\s.]?\d{2}[\s.]?\d{3}[\s.]?\d{2}[\s.]?\d{2}"),
+]
+
+# All phone patterns as one alternation, so page text is scanned once
+_PHONE_PATTERN = re.compile("|".join(f"(?:{p.pattern})" for p in PHONE_PATTERNS))
+
+# Separators stripped when normalizing phone numbers
+_PHONE_SEPARATORS_RE = re.compile(r"[\s.\-()]+")
+
+# Keywords indicating CV/resume documents (case-insensitive)
+CV_KEYWORDS = {"cv", "resume", "curriculum", "vitae", "lebenslauf"}
+
+
+@dataclass
+class PageLinks:
+    """Contact details and document links found on a page."""
+
+    emails: list[str] = field(default_factory=list)
+    phones: list[str] = field(default_factory=list)
+    cv_links: list[str] = field(default_factory=list)
+    pdf_links: list[str] = field(default_factory=list)
+
+
+def _get_str_attr(tag: "Tag", attr: str, default: str = "") -> str:
+    """Safely get string attribute from BS4 tag (handles list returns)."""
+    val = tag.get(attr)
+    if val is None:
+        return default
+    if isinstance(val, list):
+        return val[0] if val else default
+    return val
+
+
+def extract_page_links(
+    soup: SoupElement,
+    base_url: str | None = None,
+    *,
+    emails: bool = True,
+    phones: bool = True,
+    cv_links: bool = True,
+    pdf_links: bool = True,
+) -> PageLinks:
+    """
+    Extract emails, phones, CV links and PDF links in one pass.
+
+    Sources:
+    1. mailto:, tel: and .pdf links (primary, most reliable)
+    2. Visible text content (regex scan for emails and phones, conservative)
+
+    Args:
+        soup: BeautifulSoup document or Tag element
+        base_url: Base URL for resolving relative URLs; when None, no
+            document links are collected
+        emails: Collect email addresses
+        phones: Collect phone numbers
+        cv_links: Collect CV/resume PDF links (requires base_url)
+        pdf_links: Collect all PDF links (requires base_url)
+
+    Returns:
+        PageLinks with each requested list deduplicated in discovery order;
+        lists that were not requested are left empty
+    """
+    links = PageLinks()
+    documents = cv_links or pdf_links
+
+    for link in soup.find_all("a", href=True):
+        href = _get_str_attr(link, "href")
+        href_lower = href.lower()
+
+        if emails and href_lower.startswith("mailto:"):
+            _add_mailto_emails(href, links.emails)
+        elif phones and href_lower.startswith("tel:"):
+            _add_tel_phone(href, links.phones)
+
+        if documents and base_url is not None and ".pdf" in href_lower:
+            full_url = urljoin(base_url, href)
+            if pdf_links and full_url not in links.pdf_links:
+                links.pdf_links.append(full_url)
+            if cv_links and full_url not in links.cv_links and _is_cv_link(link, full_url):
+                links.cv_links.append(full_url)
+
+    # The text scan only finds contacts, so skip it for document-only calls
+    if not (emails or phones):
+        return links
+
+    text = soup.get_text(separator=" ", strip=True)
+    if emails:
+        for match in EMAIL_PATTERN.finditer(text):
+            email = match.group(0).lower()
+            if email not in links.emails:
+                links.emails.append(email)
+    if phones:
+        for match in _PHONE_PATTERN.finditer(text):
+            phone = _normalize_phone(match.group(0))
+            if phone not in links.phones and len(phone) >= 10:
+                links.phones.append(phone)
+
+    return links
+
+
+def _add_mailto_emails(href: str, emails: list[str]) -> None:
+    """Append new addresses from a mailto: href to emails."""
+    # Remove mailto: prefix and any query params (?subject=...)
+    mailto_content = href[7:].split("?")[0].strip()
+    mailto_content = unquote(mailto_content)  # Handle URL-encoded characters
+    # Handle display names like "John Doe" <john@example.com> and multiple recipients
+    for match in EMAIL_PATTERN.finditer(mailto_content):
+        email = match.group(0).lower()
+        if email not in emails:
+            emails.append(email)
+
+
+def _add_tel_phone(href: str, phones: list[str]) -> None:
+    """Append the number from a tel: href to phones if new and plausible."""
+    normalized = _normalize_phone(unquote(href[4:].strip()))
+    # Validate: must have at least 7 digits (shortest valid phone numbers)
+    if normalized and len(normalized) >= 7 and normalized not in phones:
+        phones.append(normalized)
+
+
+def _normalize_phone(phone: str) -> str:
+    """Normalize phone number to consistent format."""
+    # Remove common separators, keep + prefix
+    return _PHONE_SEPARATORS_RE.sub("", phone)
+
+
+def _is_cv_link(link: "Tag", full_url: str) -> bool:
+    """Check whether a PDF link's filename or anchor text has a CV keyword."""
+    # Check filename for CV keywords
+    try:
+        parsed = urlparse(full_url)
+        filename = unquote(Path(parsed.path).name).lower()
+    except Exception:
+        filename = ""
+
+    # Check anchor text for CV keywords
+    anchor_text = link.get_text(strip=True).lower()
+
+    # Match if keywords found in filename or anchor text
+    return any(kw in filename or kw in anchor_text for kw in CV_KEYWORDS)
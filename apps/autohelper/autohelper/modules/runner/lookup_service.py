@@ -6,7 +6,6 @@ Can find artifacts by ID or content hash, even if files have been moved.
 """
 
 import asyncio
-import hashlib
 import json
 import logging
 from pathlib import Path
@@ -16,6 +15,7 @@ from autohelper.config.settings import Settings, get_settings
 from autohelper.db.conn import get_db
 
 from ..storage.router import get_metadata_backend
+from .naming import compute_content_hash_streaming
 from .types import ArtifactManifestEntry, CollectionManifest
 
 logger = logging.getLogger(__name__)
@@ -374,11 +374,7 @@ class ArtifactLookupService:
         """
         def _hash_file() -> str:
             try:
-                sha256 = hashlib.sha256()
-                with open(file_path, "rb") as f:
-                    for chunk in iter(lambda: f.read(65536), b""):
-                        sha256.update(chunk)
-                return sha256.hexdigest()
+                return compute_content_hash_streaming(Path(file_path))
             except FileNotFoundError:
                 logger.error(f"File not found for hashing: {file_path}")
                 raise
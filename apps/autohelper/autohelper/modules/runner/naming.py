@@ -8,6 +8,7 @@ import hashlib
 import re
 import unicodedata
 import uuid
+import zlib
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -15,6 +16,17 @@ from urllib.parse import urlparse
 
 from .types import NamingConfig, NumberingMode
 
+# Slug normalization patterns
+_SLUG_SEPARATORS_RE = re.compile(r"[\s_]+")
+_SLUG_INVALID_RE = re.compile(r"[^a-z0-9\-]")
+_SLUG_HYPHENS_RE = re.compile(r"-+")
+
+# Template placeholders such as {index} or {hash}
+_TEMPLATE_VAR_RE = re.compile(r"\{(\w+)\}")
+
+# Characters not allowed in generated filenames
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+
 
 class IndexCounter:
     """
@@ -88,11 +100,11 @@ def _slugify(text: str, max_length: int = 50) -> str:
 
     # Lowercase and replace spaces/underscores with hyphens
     slug = ascii_text.lower().strip()
-    slug = re.sub(r"[\s_]+", "-", slug)
+    slug = _SLUG_SEPARATORS_RE.sub("-", slug)
     # Remove non-alphanumeric characters except hyphens
-    slug = re.sub(r"[^a-z0-9\-]", "", slug)
+    slug = _SLUG_INVALID_RE.sub("", slug)
     # Collapse multiple hyphens
-    slug = re.sub(r"-+", "-", slug)
+    slug = _SLUG_HYPHENS_RE.sub("-", slug)
     # Trim leading/trailing hyphens
     slug = slug.strip("-")
     # Truncate
@@ -228,7 +240,7 @@ def generate_filename(
         )
 
     # Replace {var} patterns
-    filename = re.sub(r"\{(\w+)\}", replace_var, template)
+    filename = _TEMPLATE_VAR_RE.sub(replace_var, template)
 
     # Apply prefix and suffix
     if config.prefix:
@@ -240,7 +252,7 @@ def generate_filename(
     filename = f"{filename}{extension}"
 
     # Sanitize filename (remove dangerous characters)
-    filename = re.sub(r'[<>:"/\\|?*]', "", filename)
+    filename = _UNSAFE_FILENAME_CHARS_RE.sub("", filename)
     filename = filename.strip(". ")
 
     # If sanitization removed the entire filename, use fallback with prefix/suffix
@@ -315,7 +327,7 @@ def generate_persistent_id(
     Returns:
         UUID string (stable for same inputs)
     """
-    content_hash = hashlib.sha256(content).hexdigest()
+    content_hash = compute_content_hash(content)
     normalized_source = _normalize_source(source)
     normalized_timestamp = _normalize_timestamp(timestamp)
     id_input = f"{content_hash}:{normalized_source}:{normalized_timestamp}"
@@ -347,6 +359,19 @@ def generate_persistent_id_from_hash(
     return str(uuid.uuid5(uuid.NAMESPACE_URL, id_input))
 
 
+def new_content_hasher() -> "hashlib._Hash":
+    """
+    Create an incremental hasher for artifact content.
+
+    Feed it chunks with update() while reading or downloading, so content
+    is hashed in the same pass rather than traversed a second time.
+
+    Returns:
+        SHA-256 hash object
+    """
+    return hashlib.sha256()
+
+
 def compute_content_hash(content: bytes) -> str:
     """
     Compute SHA-256 hash of file content.
@@ -357,7 +382,9 @@ def compute_content_hash(content: bytes) -> str:
     Returns:
         Hex-encoded hash string
     """
-    return hashlib.sha256(content).hexdigest()
+    hasher = new_content_hasher()
+    hasher.update(content)
+    return hasher.hexdigest()
 
 
 def compute_content_hash_streaming(file_path: Path, chunk_size: int = 65536) -> str:
@@ -374,22 +401,27 @@ def compute_content_hash_streaming(file_path: Path, chunk_size: int = 65536) ->
     Returns:
         Hex-encoded hash string
     """
-    sha256 = hashlib.sha256()
+    hasher = new_content_hasher()
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(chunk_size), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+        # Reuse one buffer rather than allocating a bytes object per chunk
+        while read := f.readinto(buffer):
+            hasher.update(view[:read])
+    return hasher.hexdigest()
 
 
 def compute_url_hash(url: str) -> str:
     """
-    Compute MD5 hash of URL (for filename generation, not security).
+    Compute CRC-32 of URL (for filename generation, not security).
+
+    The value only disambiguates filenames within a collection, so a
+    non-cryptographic checksum is sufficient and much cheaper than a digest.
 
     Args:
         url: URL string
 
     Returns:
-        First 8 characters of hex-encoded hash
+        8-character hex-encoded checksum
     """
-    # usedforsecurity=False: This hash is for filename shortening, not cryptographic security
-    return hashlib.md5(url.encode(), usedforsecurity=False).hexdigest()[:8]
+    return f"{zlib.crc32(url.encode()):08x}"
@@ -4,9 +4,12 @@ SSRF-protected HTTP client.
 Provides an HTTP client wrapper that validates URLs and redirects for SSRF protection.
 """
 
+import importlib.util
 import types
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
-from urllib.parse import urljoin
+from urllib.parse import urljoin, urlparse
 
 from .validation import is_safe_url
 
@@ -15,6 +18,7 @@ if TYPE_CHECKING:
 
 # Lazy import for optional httpx dependency
 _httpx = None
+_h2_available: bool | None = None
 
 
 def _get_httpx() -> types.ModuleType:
@@ -32,17 +36,109 @@ def _get_httpx() -> types.ModuleType:
     return _httpx
 
 
-class SSRFProtectedClient:
-    """HTTP client wrapper that validates URLs for SSRF protection."""
+def _http2_available() -> bool:
+    """Check for the optional h2 package that httpx needs for HTTP/2."""
+    global _h2_available
+    if _h2_available is None:
+        _h2_available = importlib.util.find_spec("h2") is not None
+    return _h2_available
+
+
+def _host_key(url: str) -> str | None:
+    """
+    Return the lowercased hostname of an http(s) URL.
+
+    Returns None for other schemes or unparseable URLs so they are always
+    re-validated.
+    """
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        return None
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        return None
+    return parsed.hostname.lower()
 
-    def __init__(self, timeout: float = 30.0):
+
+class SSRFProtectedClient:
+    """
+    HTTP client wrapper that validates URLs for SSRF protection.
+
+    Holds one pooled httpx.AsyncClient so repeated fetches reuse connections
+    (keep-alive) instead of paying TCP/TLS setup per request. When the
+    optional h2 package is installed, HTTPS hosts that support HTTP/2 get
+    all requests multiplexed over a single connection. Use as an async
+    context manager, or call aclose() when done.
+    """
+
+    def __init__(
+        self,
+        timeout: float = 30.0,
+        max_connections: int = 32,
+        max_keepalive_connections: int = 16,
+        http2: bool = True,
+    ):
         """
         Initialize the SSRF-protected client.
 
         Args:
             timeout: Request timeout in seconds
+            max_connections: Maximum concurrent connections in the pool
+            max_keepalive_connections: Maximum idle connections kept alive
+            http2: Negotiate HTTP/2 when available (requires the http2 extra)
         """
         self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.http2 = http2
+        self._client: httpx.AsyncClient | None = None
+        # Hosts that passed validation during this client's lifetime
+        self._safe_hosts: set[str] = set()
+
+    async def __aenter__(self) -> "SSRFProtectedClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
+
+    def _get_client(self) -> "httpx.AsyncClient":
+        """Create the pooled client on first use."""
+        if self._client is None:
+            httpx = _get_httpx()
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                follow_redirects=False,  # Handle redirects manually
+                http2=self.http2 and _http2_available(),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_keepalive_connections,
+                ),
+            )
+        return self._client
+
+    async def check_url(self, url: str) -> tuple[bool, str]:
+        """
+        Validate url like is_safe_url, skipping hosts this client already passed.
+
+        A client lives for one collection, so many URLs on the same host
+        (a gallery on one CDN) cost a single validation.
+
+        Returns:
+            Tuple of (is_safe, error_message)
+        """
+        host = _host_key(url)
+        if host is not None and host in self._safe_hosts:
+            return True, ""
+        is_safe, error_msg = await is_safe_url(url)
+        if is_safe and host is not None:
+            self._safe_hosts.add(host)
+        return is_safe, error_msg
 
     async def get(self, url: str) -> "httpx.Response":
         """
@@ -57,41 +153,70 @@ class SSRFProtectedClient:
         Raises:
             ValueError: If URL or any redirect is blocked by SSRF protection
         """
-        httpx = _get_httpx()
+        return await self._send("GET", url, stream=False)
+
+    async def head(self, url: str) -> "httpx.Response":
+        """
+        Issue a HEAD request with the same SSRF checks as get().
 
+        Raises:
+            ValueError: If URL or any redirect is blocked by SSRF protection
+        """
+        return await self._send("HEAD", url, stream=False)
+
+    @asynccontextmanager
+    async def stream(self, url: str) -> AsyncIterator["httpx.Response"]:
+        """
+        Fetch URL like get(), but leave the body unread for streaming.
+
+        Iterate the body with response.aiter_bytes(); the response is closed
+        when the context exits.
+
+        Raises:
+            ValueError: If URL or any redirect is blocked by SSRF protection
+        """
+        response = await self._send("GET", url, stream=True)
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+    async def _send(self, method: str, url: str, stream: bool) -> "httpx.Response":
+        """Issue a request, validating the initial URL and each redirect hop."""
         # Validate initial URL for SSRF protection (defense in depth)
-        is_safe, error_msg = await is_safe_url(url)
+        is_safe, error_msg = await self.check_url(url)
         if not is_safe:
             raise ValueError(f"Unsafe URL blocked: {error_msg}")
 
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            follow_redirects=False,  # Handle redirects manually
-        ) as client:
-            max_redirects = 10
-            current_url = url
+        client = self._get_client()
+        max_redirects = 10
+        current_url = url
 
-            for _ in range(max_redirects):
-                response = await client.get(current_url)
+        for _ in range(max_redirects):
+            request = client.build_request(method, current_url)
+            response = await client.send(request, stream=stream)
 
-                # Check if this is a redirect
-                if response.status_code in (301, 302, 303, 307, 308):
-                    redirect_url = response.headers.get("location")
-                    if not redirect_url:
-                        raise ValueError("Redirect response missing Location header")
+            # Check if this is a redirect
+            if response.status_code in (301, 302, 303, 307, 308):
+                # Release the connection before following the redirect
+                await response.aclose()
+                redirect_url = response.headers.get("location")
+                if not redirect_url:
+                    raise ValueError("Redirect response missing Location header")
 
-                    # Make absolute URL if relative
-                    redirect_url = urljoin(current_url, redirect_url)
+                # Make absolute URL if relative
+                redirect_url = urljoin(current_url, redirect_url)
 
-                    # Validate redirect URL for SSRF (using async to avoid blocking)
-                    is_safe, error_msg = await is_safe_url(redirect_url)
-                    if not is_safe:
-                        raise ValueError(f"Unsafe redirect blocked: {error_msg}")
+                # Validate redirect URL for SSRF; hosts already passed by this
+                # client (e.g. same-host hops like /foo -> /foo/) are not re-checked
+                is_safe, error_msg = await self.check_url(redirect_url)
+                if not is_safe:
+                    raise ValueError(f"Unsafe redirect blocked: {error_msg}")
 
-                    current_url = redirect_url
-                    continue
+                current_url = redirect_url
+                continue
 
-                # Not a redirect, return response
-                return response
+            # Not a redirect, return response
+            return response
 
-            raise ValueError(f"Too many redirects (max {max_redirects})")
+        raise ValueError(f"Too many redirects (max {max_redirects})")
@@ -9,6 +9,10 @@ import ipaddress
 # DNS resolution timeout in seconds
 DNS_TIMEOUT_SECONDS = 10.0
 
+# How long successful DNS resolutions are reused, and how many hosts are kept
+DNS_CACHE_TTL_SECONDS = 300.0
+DNS_CACHE_MAX_ENTRIES = 1024
+
 # Blocked hostnames/patterns for SSRF protection
 BLOCKED_HOSTNAMES = {
     "localhost",
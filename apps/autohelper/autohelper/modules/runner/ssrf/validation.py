@@ -7,9 +7,18 @@ Provides DNS resolution and IP range checking for safe URL access.
 import asyncio
 import ipaddress
 import socket
+import struct
+import time
+from bisect import bisect_right
 from urllib.parse import urlparse
 
-from .constants import BLOCKED_HOSTNAMES, DNS_TIMEOUT_SECONDS, PRIVATE_IP_RANGES
+from .constants import (
+    BLOCKED_HOSTNAMES,
+    DNS_CACHE_MAX_ENTRIES,
+    DNS_CACHE_TTL_SECONDS,
+    DNS_TIMEOUT_SECONDS,
+    PRIVATE_IP_RANGES,
+)
 
 # Blocked hostname suffixes for subdomain matching
 BLOCKED_HOSTNAME_SUFFIXES = {
@@ -19,16 +28,52 @@ BLOCKED_HOSTNAME_SUFFIXES = {
 }
 
 
+def _build_range_table(version: int) -> tuple[list[int], list[int]]:
+    """
+    Merge PRIVATE_IP_RANGES of one IP version into sorted integer intervals.
+
+    Returns:
+        Tuple of (starts, ends) lists for bisect lookups
+    """
+    intervals = sorted(
+        (int(net.network_address), int(net.broadcast_address))
+        for net in PRIVATE_IP_RANGES
+        if net.version == version
+    )
+    starts: list[int] = []
+    ends: list[int] = []
+    for start, end in intervals:
+        if ends and start <= ends[-1] + 1:
+            ends[-1] = max(ends[-1], end)
+        else:
+            starts.append(start)
+            ends.append(end)
+    return starts, ends
+
+
+# Private ranges as sorted (start, end) integer tables, keyed by IP version
+_PRIVATE_RANGE_TABLES = {4: _build_range_table(4), 6: _build_range_table(6)}
+
+# Packed IPv4 address -> unsigned 32-bit integer
+_UNPACK_IPV4 = struct.Struct(">I").unpack
+
+# Successful resolutions: hostname -> (ips, monotonic time resolved)
+_dns_cache: dict[str, tuple[list[str], float]] = {}
+
+
 class DNSResolutionError(Exception):
     """Raised when DNS resolution fails for a hostname."""
 
     pass
 
 
-def _resolve_all_ips(hostname: str) -> list[str]:
+async def _resolve_all_ips(hostname: str) -> list[str]:
     """
     Resolve hostname to all IP addresses (both IPv4 and IPv6).
 
+    Uses the running loop's getaddrinfo, which is natively asynchronous
+    under uvloop and falls back to the default executor otherwise.
+
     Returns:
         List of IP address strings
 
@@ -38,7 +83,9 @@ def _resolve_all_ips(hostname: str) -> list[str]:
     ips: list[str] = []
     try:
         # Use getaddrinfo to get both IPv4 and IPv6 addresses
-        results = socket.getaddrinfo(hostname, None, socket.AF_UNSPEC, socket.SOCK_STREAM)
+        results = await asyncio.get_running_loop().getaddrinfo(
+            hostname, None, family=socket.AF_UNSPEC, type=socket.SOCK_STREAM
+        )
         for result in results:
             ip_str = str(result[4][0])  # Ensure string type for IP address
             if ip_str not in ips:
@@ -53,6 +100,42 @@ def _resolve_all_ips(hostname: str) -> list[str]:
     return ips
 
 
+def _get_cached_ips(hostname: str) -> list[str] | None:
+    """Return cached IPs for hostname if resolved within DNS_CACHE_TTL_SECONDS."""
+    entry = _dns_cache.get(hostname)
+    if entry is None:
+        return None
+    ips, resolved_at = entry
+    if time.monotonic() - resolved_at >= DNS_CACHE_TTL_SECONDS:
+        del _dns_cache[hostname]
+        return None
+    return ips
+
+
+def _cache_ips(hostname: str, ips: list[str]) -> None:
+    """Store a successful resolution, evicting the oldest entry when full."""
+    if hostname not in _dns_cache and len(_dns_cache) >= DNS_CACHE_MAX_ENTRIES:
+        del _dns_cache[next(iter(_dns_cache))]
+    _dns_cache[hostname] = (ips, time.monotonic())
+
+
+def _ip_to_int(ip_str: str) -> tuple[int, int] | None:
+    """
+    Parse an IP string straight to its integer value, without ipaddress objects.
+
+    Returns:
+        Tuple of (ip_version, value), or None if the string is not an IP address
+    """
+    try:
+        if ":" in ip_str:
+            # Drop any IPv6 zone ID (e.g. "fe80::1%eth0"); it is not part of the address
+            packed = socket.inet_pton(socket.AF_INET6, ip_str.partition("%")[0])
+            return 6, int.from_bytes(packed, "big")
+        return 4, _UNPACK_IPV4(socket.inet_pton(socket.AF_INET, ip_str))[0]
+    except OSError:
+        return None
+
+
 def _check_ips_against_private_ranges(ips: list[str]) -> tuple[bool, str]:
     """
     Check if any of the IPs are in private/internal ranges.
@@ -61,14 +144,15 @@ def _check_ips_against_private_ranges(ips: list[str]) -> tuple[bool, str]:
         Tuple of (is_private, error_message)
     """
     for ip_str in ips:
-        try:
-            ip = ipaddress.ip_address(ip_str)
-            for network in PRIVATE_IP_RANGES:
-                if ip in network:
-                    return True, f"URL resolves to private/internal IP: {ip_str}"
-        except ValueError:
+        parsed = _ip_to_int(ip_str)
+        if parsed is None:
             # Invalid IP address format, skip
             continue
+        version, value = parsed
+        starts, ends = _PRIVATE_RANGE_TABLES[version]
+        idx = bisect_right(starts, value) - 1
+        if idx >= 0 and value <= ends[idx]:
+            return True, f"URL resolves to private/internal IP: {ip_str}"
     return False, ""
 
 
@@ -108,6 +192,20 @@ async def is_safe_url(url: str) -> tuple[bool, str]:
     if "%" in hostname_lower:
         hostname_lower = hostname_lower.split("%")[0]
 
+    # IP literals (including redirect targets) need neither IDNA normalization
+    # nor DNS resolution - go straight to the blocklist and range checks
+    try:
+        ip = ipaddress.ip_address(hostname_lower)
+    except ValueError:
+        ip = None
+    if ip is not None:
+        if hostname_lower in BLOCKED_HOSTNAMES or ip.compressed in BLOCKED_HOSTNAMES:
+            return False, f"Blocked hostname: {hostname}"
+        is_private, error_msg = _check_ips_against_private_ranges([ip.compressed])
+        if is_private:
+            return False, error_msg
+        return True, ""
+
     # Handle IDNA/punycode encoding for Unicode hostnames
     try:
         # Encode to ASCII (punycode) then decode back to normalized form
@@ -125,7 +223,7 @@ async def is_safe_url(url: str) -> tuple[bool, str]:
         if hostname_normalized.endswith(suffix) or hostname_normalized == suffix.lstrip("."):
             return False, f"Blocked hostname: {hostname}"
 
-    # Check if hostname is an IP literal (skip DNS resolution)
+    # Unicode hostnames can normalize to an IP literal (e.g. full-width digits)
     try:
         ip = ipaddress.ip_address(hostname_normalized)
         is_private, error_msg = _check_ips_against_private_ranges([str(ip)])
@@ -137,20 +235,24 @@ async def is_safe_url(url: str) -> tuple[bool, str]:
         pass
 
     # Try to resolve hostname and check if IP is private
-    # Use asyncio.to_thread to avoid blocking the event loop
-    # Resolve all IPs (both IPv4 and IPv6)
-    # Add timeout to prevent unbounded blocking on slow/stuck DNS resolution
-    try:
-        ips = await asyncio.wait_for(
-            asyncio.to_thread(_resolve_all_ips, hostname_normalized),
-            timeout=DNS_TIMEOUT_SECONDS,
-        )
-    except TimeoutError:
-        # Sanitized error: don't expose timeout duration or internal details
-        return False, "DNS resolution timed out"
-    except DNSResolutionError:
-        # Sanitized error: don't expose internal DNS error details
-        return False, "DNS resolution failed for hostname"
+    # Recently resolved hosts are served from cache (failures are not cached)
+    ips = _get_cached_ips(hostname_normalized)
+    if ips is None:
+        # Resolve all IPs (both IPv4 and IPv6)
+        # Add timeout to prevent unbounded blocking on slow/stuck DNS resolution
+        try:
+            ips = await asyncio.wait_for(
+                _resolve_all_ips(hostname_normalized),
+                timeout=DNS_TIMEOUT_SECONDS,
+            )
+        except TimeoutError:
+            # Sanitized error: don't expose timeout duration or internal details
+            return False, "DNS resolution timed out"
+        except DNSResolutionError:
+            # Sanitized error: don't expose internal DNS error details
+            return False, "DNS resolution failed for hostname"
+        if ips:
+            _cache_ips(hostname_normalized, ips)
 
     if not ips:
         # No IPs resolved (shouldn't happen if no exception, but be defensive)
@@ -6,7 +6,6 @@ Stores artifact metadata in a local JSON file at:
 """
 
 import asyncio
-import json
 import logging
 from datetime import UTC, datetime
 from pathlib import Path
@@ -61,11 +60,11 @@ class ManifestStorageBackend:
 
         if self.manifest_path.exists():
             try:
-                data = await asyncio.to_thread(self.manifest_path.read_text, encoding="utf-8")
-                manifest_dict = json.loads(data)
-                self._cache = CollectionManifest.model_validate(manifest_dict)
+                data = await asyncio.to_thread(self.manifest_path.read_bytes)
+                # Parse and validate in one pass, without an intermediate dict
+                self._cache = CollectionManifest.model_validate_json(data)
                 return self._cache
-            except (json.JSONDecodeError, ValueError, ValidationError) as e:
+            except (ValueError, ValidationError) as e:
                 logger.warning(f"Failed to load manifest, creating new: {e}")
 
         # Create new manifest
@@ -83,8 +82,13 @@ class ManifestStorageBackend:
         """Save manifest to disk."""
         await self._ensure_dir()
         manifest.updated_at = datetime.now(UTC).isoformat()
-        data = manifest.model_dump_json(indent=2)
-        await asyncio.to_thread(self.manifest_path.write_text, data, encoding="utf-8")
+
+        def _write() -> None:
+            # Serializing thousands of entries is CPU work; keep it off the event loop
+            data = manifest.model_dump_json(indent=2)
+            self.manifest_path.write_text(data, encoding="utf-8")
+
+        await asyncio.to_thread(_write)
         self._cache = manifest
 
     async def save_artifact(self, artifact: ArtifactManifestEntry) -> None:
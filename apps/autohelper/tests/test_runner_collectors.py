@@ -0,0 +1,644 @@
+"""Tests for runner collector utilities."""
+
+import asyncio
+import hashlib
+import io
+import json
+import os
+import stat
+import sys
+from collections.abc import AsyncIterator, Callable
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from PIL import Image
+
+from autohelper.modules.runner.collectors import (
+    FolderCollector,
+    WebCollector,
+    get_artifact_type,
+    open_source_folder,
+    scan_files_safe,
+)
+from autohelper.modules.runner.collectors.folder import _copy_file
+from autohelper.modules.runner.collectors.web import (
+    _dedupe_image_urls,
+    _dedupe_urls,
+    _probe_image_size,
+)
+from autohelper.modules.runner.naming import IndexCounter
+from autohelper.modules.runner.ssrf import SSRFProtectedClient, validation
+from autohelper.modules.runner.types import NamingConfig
+
+
+class TestScanFilesSafe:
+    """Test symlink-safe directory scanning."""
+
+    async def test_finds_nested_files(self, temp_dir: Path) -> None:
+        """Files in nested directories are returned as resolved paths."""
+        (temp_dir / "a" / "b").mkdir(parents=True)
+        (temp_dir / "top.jpg").write_bytes(b"1")
+        (temp_dir / "a" / "b" / "deep.png").write_bytes(b"2")
+
+        files = await scan_files_safe(temp_dir)
+
+        resolved = temp_dir.resolve()
+        assert sorted(files) == [resolved / "a" / "b" / "deep.png", resolved / "top.jpg"]
+
+    async def test_symlink_handling(self, temp_dir: Path) -> None:
+        """Symlinked dirs are not followed, escapes are dropped, duplicates collapse."""
+        source = temp_dir / "source"
+        (source / "sub").mkdir(parents=True)
+        (source / "sub" / "file.txt").write_text("inside")
+        outside = temp_dir / "outside.txt"
+        outside.write_text("outside")
+        os.symlink(source / "sub" / "file.txt", source / "link.txt")
+        os.symlink(outside, source / "escape.txt")
+        os.symlink(source / "sub", source / "dirlink")
+
+        files = await scan_files_safe(source)
+
+        assert files == [source.resolve() / "sub" / "file.txt"]
+
+    async def test_links_resolve_through_linked_directories_and_chains(
+        self, temp_dir: Path
+    ) -> None:
+        """Links via symlinked directories and link chains resolve to their real targets."""
+        source = temp_dir / "source"
+        (source / "real").mkdir(parents=True)
+        (source / "links").mkdir()
+        for name in ("a.jpg", "b.jpg", "c.jpg"):
+            (source / "real" / name).write_bytes(name.encode())
+        os.symlink(source / "real", temp_dir / "real-alias")
+        os.symlink(temp_dir / "real-alias" / "a.jpg", source / "links" / "a.jpg")
+        os.symlink("../real/b.jpg", source / "links" / "b.jpg")
+        os.symlink(source / "links" / "b.jpg", source / "links" / "chain.jpg")
+        os.symlink(temp_dir / "real-alias" / "c.jpg", source / "links" / "c.jpg")
+
+        files = await scan_files_safe(source)
+
+        real = source.resolve() / "real"
+        assert sorted(files) == [real / "a.jpg", real / "b.jpg", real / "c.jpg"]
+
+    async def test_hardlinks_collected_once(self, temp_dir: Path) -> None:
+        """Hardlinks to the same file are deduplicated like symlinks."""
+        (temp_dir / "a.jpg").write_bytes(b"1")
+        os.link(temp_dir / "a.jpg", temp_dir / "b.jpg")
+        (temp_dir / "c.jpg").write_bytes(b"1")
+
+        files = await scan_files_safe(temp_dir)
+
+        assert len(files) == 2
+        assert temp_dir.resolve() / "c.jpg" in files
+
+    async def test_symlinked_source_returns_canonical_paths(self, temp_dir: Path) -> None:
+        """Scanning through a symlinked root yields paths under the real directory."""
+        real = temp_dir / "real"
+        (real / "sub").mkdir(parents=True)
+        (real / "sub" / "a.jpg").write_bytes(b"1")
+        os.symlink(real, temp_dir / "alias")
+
+        files = await scan_files_safe(temp_dir / "alias")
+
+        assert files == [real.resolve() / "sub" / "a.jpg"]
+
+    async def test_empty_directory(self, temp_dir: Path) -> None:
+        """An empty directory yields no files."""
+        assert await scan_files_safe(temp_dir) == []
+
+
+class TestOpenSourceFolder:
+    """Test combined source validation and scanning."""
+
+    async def test_returns_resolved_source_and_files(self, temp_dir: Path) -> None:
+        """A valid folder yields its resolved path and scanned files."""
+        (temp_dir / "a.jpg").write_bytes(b"1")
+
+        resolved_source, files = await open_source_folder(temp_dir)
+
+        assert resolved_source == temp_dir.resolve()
+        assert files == [resolved_source / "a.jpg"]
+
+    async def test_missing_source(self, temp_dir: Path) -> None:
+        """A missing path raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="does not exist"):
+            await open_source_folder(temp_dir / "missing")
+
+    async def test_file_source(self, temp_dir: Path) -> None:
+        """A file path raises NotADirectoryError."""
+        (temp_dir / "file.txt").write_text("x")
+        with pytest.raises(NotADirectoryError, match="not a directory"):
+            await open_source_folder(temp_dir / "file.txt")
+
+
+class TestFolderCollector:
+    """Test local folder collection."""
+
+    @pytest.mark.parametrize("stream", [False, True])
+    async def test_concurrent_collection_keeps_scan_order(
+        self, temp_dir: Path, stream: bool
+    ) -> None:
+        """Indices and manifest entries follow scan order regardless of completion order."""
+        source = temp_dir / "src"
+        (source / "sub").mkdir(parents=True)
+        for i in range(12):
+            folder = source / "sub" if i % 3 else source
+            (folder / f"f{i:02}.jpg").write_bytes(os.urandom(64 * (12 - i)))
+        output = temp_dir / "out"
+
+        collector = FolderCollector(max_concurrent_files=4)
+        if stream:
+            events = [
+                e async for e in collector.collect_stream(str(source), output, NamingConfig())
+            ]
+            assert events[-1].stage == "complete"
+        else:
+            result = await collector.collect(str(source), output, NamingConfig())
+            assert result.success
+            assert len(result.artifacts) == 12
+
+        manifest = json.loads((output / ".artcollector" / "manifest.json").read_text())
+        entries = manifest["artifacts"]
+        files = await scan_files_safe(source)
+        assert [e["source_path"] for e in entries] == [str(f) for f in files]
+        assert [e["current_filename"][:3] for e in entries] == [f"{i:03}" for i in range(1, 13)]
+
+    async def test_copies_hash_and_metadata_in_one_pass(self, temp_dir: Path) -> None:
+        """Copies match the source bytes, hash and mtime, with no temp files left."""
+        source = temp_dir / "src"
+        source.mkdir()
+        data = os.urandom(3 * 1024 * 1024 + 17)
+        (source / "big.pdf").write_bytes(data)
+        os.utime(source / "big.pdf", (1_000_000_000, 1_000_000_000))
+        output = temp_dir / "out"
+
+        result = await FolderCollector().collect(str(source), output, NamingConfig())
+
+        assert result.success
+        copy = Path(result.artifacts[0].path)
+        assert copy.read_bytes() == data
+        assert copy.stat().st_mtime == 1_000_000_000
+        entry = json.loads((output / ".artcollector" / "manifest.json").read_text())["artifacts"][0]
+        assert entry["content_hash"] == hashlib.sha256(data).hexdigest()
+        assert entry["size"] == len(data)
+        assert not list(output.glob("*.part"))
+
+    async def test_hardlink_mode_shares_source_inode(self, temp_dir: Path) -> None:
+        """Hardlink mode links files on the same filesystem instead of copying."""
+        source = temp_dir / "src"
+        source.mkdir()
+        data = os.urandom(1000)
+        (source / "a.jpg").write_bytes(data)
+
+        collector = FolderCollector(copy_mode="hardlink")
+        result = await collector.collect(str(source), temp_dir / "out", NamingConfig())
+
+        copy = Path(result.artifacts[0].path)
+        assert os.path.samefile(copy, source / "a.jpg")
+        entry = json.loads((temp_dir / "out" / ".artcollector" / "manifest.json").read_text())[
+            "artifacts"
+        ][0]
+        assert entry["content_hash"] == hashlib.sha256(data).hexdigest()
+        assert entry["size"] == len(data)
+
+    async def test_link_modes_fall_back_to_copy(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Files are copied when the filesystem refuses to link them."""
+
+        def _refuse(*args: object) -> None:
+            raise OSError(18, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "link", _refuse)
+        source = temp_dir / "src"
+        source.mkdir()
+        (source / "a.jpg").write_bytes(b"data")
+
+        collector = FolderCollector(copy_mode="hardlink")
+        result = await collector.collect(str(source), temp_dir / "out", NamingConfig())
+
+        copy = Path(result.artifacts[0].path)
+        assert copy.read_bytes() == b"data"
+        assert not os.path.samefile(copy, source / "a.jpg")
+        assert not list((temp_dir / "out").glob("*.part"))
+
+    @pytest.mark.skipif(sys.platform != "linux", reason="counts descriptors via /proc/self/fd")
+    @pytest.mark.parametrize("copy_mode", ["copy", "reflink"])
+    def test_unreadable_source_leaks_no_descriptor(self, temp_dir: Path, copy_mode: str) -> None:
+        """A source that cannot be opened leaves no open temp file and no .part file."""
+        open_fds = len(os.listdir("/proc/self/fd"))
+
+        for _ in range(20):
+            with pytest.raises(FileNotFoundError):
+                _copy_file(temp_dir / "missing.jpg", temp_dir, lambda h: f"{h}.jpg", copy_mode)
+
+        assert len(os.listdir("/proc/self/fd")) == open_fds
+        assert not list(temp_dir.glob("*.part"))
+
+
+def _png(width: int, height: int) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _serve(monkeypatch: pytest.MonkeyPatch, handler: Callable[..., Any]) -> None:
+    """Back every SSRFProtectedClient created during the test with handler."""
+
+    def _get_client(self: SSRFProtectedClient) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return self._client
+
+    monkeypatch.setattr(SSRFProtectedClient, "_get_client", _get_client)
+
+
+class TestProbeImageSize:
+    """Test header-only dimension parsing."""
+
+    @pytest.mark.parametrize(
+        ("image_format", "options"),
+        [
+            ("PNG", {}),
+            ("GIF", {}),
+            ("JPEG", {}),
+            ("JPEG", {"progressive": True, "icc_profile": b"\0" * 5000}),
+            ("WEBP", {}),
+            ("WEBP", {"lossless": True}),
+            ("WEBP", {"exif": b"Exif\0\0MM\0*\0\0\0\x08\0\0"}),
+        ],
+    )
+    def test_matches_pillow(self, image_format: str, options: dict) -> None:
+        """Dimensions match Pillow's; truncated headers give None, never a wrong size."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (513, 257)).save(buffer, image_format, **options)
+        data = buffer.getvalue()
+
+        assert _probe_image_size(data) == (513, 257)
+        for end in range(0, len(data), 11):
+            assert _probe_image_size(data[:end]) in (None, (513, 257))
+
+    def test_unknown_format(self) -> None:
+        """Formats without a header parser are left to Pillow after download."""
+        buffer = io.BytesIO()
+        Image.new("RGB", (10, 10)).save(buffer, "BMP")
+        assert _probe_image_size(buffer.getvalue()) is None
+
+
+class TestWebCollectorDownloads:
+    """Test image download filtering."""
+
+    @pytest.fixture(autouse=True)
+    def public_dns(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        async def _resolve(hostname: str) -> list[str]:
+            return ["93.184.216.34"]
+
+        validation._dns_cache.clear()
+        monkeypatch.setattr(validation, "_resolve_all_ips", _resolve)
+
+    async def test_out_of_bounds_dimensions_stop_the_download(self, temp_dir: Path) -> None:
+        """Images are rejected from their header, before the rest of the body is read."""
+        chunks_sent = 0
+
+        async def _body() -> AsyncIterator[bytes]:
+            nonlocal chunks_sent
+            yield _png(8000, 50)
+            for _ in range(50):
+                chunks_sent += 1
+                yield b"\0" * 65536
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "HEAD":
+                return httpx.Response(405)
+            return httpx.Response(200, content=_body(), headers={"content-type": "image/png"})
+
+        client = SSRFProtectedClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        collector = WebCollector(min_filesize_kb=0)
+        async with client:
+            result = await collector._download_image(
+                client, "https://example.com/wide.png", temp_dir
+            )
+
+        assert result is None
+        assert chunks_sent <= 1
+        assert not list(temp_dir.iterdir())
+
+    async def test_head_rejects_non_image_without_get(self, temp_dir: Path) -> None:
+        """A non-image Content-Type on HEAD skips the URL before any GET is sent."""
+        methods: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            methods.append(request.method)
+            return httpx.Response(200, headers={"content-type": "text/html; charset=utf-8"})
+
+        client = SSRFProtectedClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            result = await WebCollector()._download_image(
+                client, "https://example.com/page", temp_dir
+            )
+
+        assert result is None
+        assert methods == ["HEAD"]
+
+    async def test_images_numbered_in_page_order(self, temp_dir: Path) -> None:
+        """Indices follow URL order, without gaps, whatever order downloads finish in."""
+        urls = [f"https://example.com/{i}.png" for i in range(4)]
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "HEAD":
+                return httpx.Response(405)
+            i = int(request.url.path[1])
+            await asyncio.sleep((4 - i) * 0.01)
+            body = _png(50, 50) if i == 1 else _png(200 + i, 200)
+            return httpx.Response(200, content=body, headers={"content-type": "image/png"})
+
+        client = SSRFProtectedClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        collector = WebCollector(min_filesize_kb=0)
+        async with client:
+            tasks = collector._start_image_downloads(client, urls, temp_dir)
+            downloads = await asyncio.gather(*tasks)
+            results = await collector._save_images(
+                urls,
+                downloads,
+                temp_dir,
+                IndexCounter(),
+                NamingConfig(),
+                "https://example.com/",
+                "2024-01-01T00:00:00+00:00",
+            )
+
+        entries = [entry for _, entry in results]
+        assert [e.source_url for e in entries] == [urls[0], urls[2], urls[3]]
+        assert [e.current_filename[:3] for e in entries] == ["001", "002", "003"]
+        assert sorted(p.name for p in temp_dir.iterdir()) == [e.current_filename for e in entries]
+
+    async def test_duplicate_sub_pages_are_not_parsed(self, temp_dir: Path) -> None:
+        """Sub-pages repeating the source page or an earlier sub-page are skipped."""
+        bodies = {"/": b"<p>home</p>", "/a": b"<p>a</p>", "/b": b"<p>a</p>", "/c": b"<p>home</p>"}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, content=bodies[request.url.path])
+
+        client = SSRFProtectedClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            pages = await WebCollector()._fetch_pages(
+                client,
+                ["https://example.com/a", "https://example.com/b", "https://example.com/c"],
+                bodies["/"],
+            )
+
+        assert [(url, soup.p.text) for url, soup in pages] == [("https://example.com/a", "a")]
+
+    @pytest.mark.parametrize("stream", [False, True])
+    async def test_image_variants_do_not_count_toward_max_images(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch, stream: bool
+    ) -> None:
+        """Size/cache-busting variants collapse before the max_images cap is applied."""
+        html = (
+            '<img src="/a.jpg?w=300"><img src="/a.jpg?w=600"><img src="/a.jpg?w=900">'
+            '<img src="/b.jpg"><img src="/c.jpg">'
+        )
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/":
+                return httpx.Response(200, text=html, headers={"content-type": "text/html"})
+            if request.method == "HEAD":
+                return httpx.Response(405)
+            return httpx.Response(
+                200, content=_png(200, 200), headers={"content-type": "image/png"}
+            )
+
+        _serve(monkeypatch, handler)
+        collector = WebCollector(max_images=3, min_filesize_kb=0)
+        if stream:
+            events = [
+                e
+                async for e in collector.collect_stream(
+                    "https://example.com/", temp_dir, NamingConfig()
+                )
+            ]
+            assert events[-1].stage == "complete"
+        else:
+            assert (
+                await collector.collect("https://example.com/", temp_dir, NamingConfig())
+            ).success
+
+        manifest = json.loads((temp_dir / ".artcollector" / "manifest.json").read_text())
+        assert [e["source_url"] for e in manifest["artifacts"]] == [
+            "https://example.com/a.jpg?w=900",
+            "https://example.com/b.jpg",
+            "https://example.com/c.jpg",
+        ]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    async def test_saved_images_get_default_file_mode(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Saved images get the umask-derived mode, not mkstemp's 0600."""
+        reference = temp_dir / "reference"
+        reference.write_bytes(b"")
+        expected_mode = stat.S_IMODE(reference.stat().st_mode)
+        reference.unlink()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/":
+                return httpx.Response(
+                    200, text='<img src="/a.png">', headers={"content-type": "text/html"}
+                )
+            if request.method == "HEAD":
+                return httpx.Response(405)
+            return httpx.Response(
+                200, content=_png(200, 200), headers={"content-type": "image/png"}
+            )
+
+        _serve(monkeypatch, handler)
+        result = await WebCollector(min_filesize_kb=0).collect(
+            "https://example.com/", temp_dir, NamingConfig()
+        )
+
+        assert result.success
+        (image,) = temp_dir.glob("*.png")
+        assert stat.S_IMODE(image.stat().st_mode) == expected_mode
+
+    async def test_thumbnail_listed_first_does_not_replace_full_image(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A small variant seen before the full-size one is not what gets downloaded."""
+        html = '<img src="/a.png?w=50"><img src="/a.png?w=400">'
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/":
+                return httpx.Response(200, text=html, headers={"content-type": "text/html"})
+            if request.method == "HEAD":
+                return httpx.Response(405)
+            width = int(request.url.params["w"])
+            return httpx.Response(
+                200, content=_png(width, width), headers={"content-type": "image/png"}
+            )
+
+        _serve(monkeypatch, handler)
+        collector = WebCollector(min_width=100, min_filesize_kb=0)
+        result = await collector.collect("https://example.com/", temp_dir, NamingConfig())
+
+        assert result.success
+        manifest = json.loads((temp_dir / ".artcollector" / "manifest.json").read_text())
+        assert [e["source_url"] for e in manifest["artifacts"]] == [
+            "https://example.com/a.png?w=400"
+        ]
+
+    async def test_closing_stream_mid_download_leaves_no_temp_files(
+        self, temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Finished and in-flight downloads are removed when the stream is closed early."""
+        html = "".join(f'<img src="/{i}.png">' for i in range(8))
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/":
+                return httpx.Response(200, text=html, headers={"content-type": "text/html"})
+            if request.method == "HEAD":
+                return httpx.Response(405)
+            await asyncio.sleep(int(request.url.path[1]) * 0.01)
+            return httpx.Response(
+                200,
+                content=_png(200 + int(request.url.path[1]), 200),
+                headers={"content-type": "image/png"},
+            )
+
+        _serve(monkeypatch, handler)
+        stream = WebCollector(min_filesize_kb=0).collect_stream(
+            "https://example.com/", temp_dir, NamingConfig()
+        )
+        async for event in stream:
+            if event.stage == "downloading":
+                break
+        await stream.aclose()
+
+        assert not list(temp_dir.glob("*.part"))
+        assert not list(temp_dir.glob("*.png"))
+
+    async def test_cv_pdfs_stream_to_disk_in_link_order(self, temp_dir: Path) -> None:
+        """CV PDFs are hashed while streaming and numbered in link order."""
+        bodies = {"/first.pdf": b"%PDF-1.4 first" * 5000, "/second.pdf": b"%PDF-1.4 second"}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/page.html":
+                return httpx.Response(200, content=b"<html>", headers={"content-type": "text/html"})
+            return httpx.Response(
+                200, content=bodies[request.url.path], headers={"content-type": "application/pdf"}
+            )
+
+        client = SSRFProtectedClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            results = await WebCollector()._download_cv_pdfs(
+                client,
+                [
+                    "https://example.com/first.pdf",
+                    "https://example.com/page.html",
+                    "https://example.com/second.pdf",
+                ],
+                temp_dir,
+                IndexCounter(),
+                "https://example.com/",
+                "2024-01-01T00:00:00+00:00",
+            )
+
+        assert [entry.current_filename for _, entry in results] == ["cv_001.pdf", "cv_002.pdf"]
+        for (_, entry), body in zip(results, bodies.values(), strict=True):
+            assert entry.content_hash == hashlib.sha256(body).hexdigest()
+            assert entry.size == len(body)
+            assert (temp_dir / entry.current_filename).read_bytes() == body
+        assert sorted(p.name for p in temp_dir.iterdir()) == ["cv_001.pdf", "cv_002.pdf"]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    async def test_cv_pdfs_get_default_file_mode(self, temp_dir: Path) -> None:
+        """Saved CV PDFs get the umask-derived mode, not mkstemp's 0600."""
+        reference = temp_dir / "reference"
+        reference.write_bytes(b"")
+        expected_mode = stat.S_IMODE(reference.stat().st_mode)
+        reference.unlink()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(
+                200, content=b"%PDF-1.4", headers={"content-type": "application/pdf"}
+            )
+
+        client = SSRFProtectedClient()
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        async with client:
+            ((_, entry),) = await WebCollector()._download_cv_pdfs(
+                client,
+                ["https://example.com/cv.pdf"],
+                temp_dir,
+                IndexCounter(),
+                "https://example.com/",
+                "2024-01-01T00:00:00+00:00",
+            )
+
+        pdf = temp_dir / entry.current_filename
+        assert stat.S_IMODE(pdf.stat().st_mode) == expected_mode
+
+
+class TestDedupeUrls:
+    """Test canonical URL deduplication."""
+
+    def test_equivalent_urls_collapse_to_first_occurrence(self) -> None:
+        """Case, default ports, fragments, query order and trailing slashes are ignored."""
+        urls = [
+            "https://example.com/img/a.jpg?id=2&w=300",
+            "HTTPS://Example.COM:443/img/a.jpg?w=300&id=2#top",
+            "https://example.com/pages/about/",
+            "https://example.com/pages/about",
+            "https://example.com:8443/img/a.jpg?id=2&w=300",
+            "https://example.com/img/a.jpg?id=2&w=600",
+            "http://example.com/img/a.jpg?id=2&w=300",
+        ]
+        assert _dedupe_urls(urls) == [
+            "https://example.com/img/a.jpg?id=2&w=300",
+            "https://example.com/pages/about/",
+            "https://example.com:8443/img/a.jpg?id=2&w=300",
+            "https://example.com/img/a.jpg?id=2&w=600",
+            "http://example.com/img/a.jpg?id=2&w=300",
+        ]
+
+    def test_image_variants_keep_largest_rendition(self) -> None:
+        """Variant params are ignored; each image keeps its largest w/h rendition."""
+        urls = [
+            "https://example.com/img/a.jpg?id=2&w=50",
+            "https://example.com/img/b.jpg?v=1",
+            "https://example.com/img/a.jpg?h=80&id=2&fit=crop",
+            "https://example.com/img/a.jpg?id=2&w=400",
+            "https://example.com/img/b.jpg?v=2",
+            "https://example.com/img/c.jpg?w=800",
+            "https://example.com/img/c.jpg?cb=xyz",
+            "https://example.com/img/a.jpg?id=3",
+        ]
+        assert _dedupe_image_urls(urls) == [
+            "https://example.com/img/a.jpg?id=2&w=400",
+            "https://example.com/img/b.jpg?v=1",
+            "https://example.com/img/c.jpg?cb=xyz",
+            "https://example.com/img/a.jpg?id=3",
+        ]
+
+    def test_page_urls_keep_query_parameters(self) -> None:
+        """Page URLs keep ?t= and ?v=, which can name distinct pages."""
+        urls = ["https://forum.example.com/view?t=1", "https://forum.example.com/view?t=2"]
+        assert _dedupe_urls(urls) == urls
+
+
+class TestGetArtifactType:
+    """Test extension to artifact type mapping."""
+
+    def test_known_and_unknown_extensions(self) -> None:
+        """Images and documents are classified; anything else is a plain file."""
+        assert get_artifact_type(".JPG") == "image"
+        assert get_artifact_type("webp") == "image"
+        assert get_artifact_type(".pdf") == "document"
+        assert get_artifact_type(".zip") == "file"
+        assert get_artifact_type("") == "file"
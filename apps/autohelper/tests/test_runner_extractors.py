@@ -0,0 +1,198 @@
+"""Tests for runner HTML content extractors."""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from autohelper.modules.runner.extractors import (
+    PageLinks,
+    extract_bio_text,
+    extract_cv_links,
+    extract_emails,
+    extract_image_urls,
+    extract_location,
+    extract_page_links,
+    extract_pdf_links,
+    extract_phones,
+)
+
+BASE_URL = "https://example.com/gallery/"
+
+
+def _soup(html: str) -> BeautifulSoup:
+    return BeautifulSoup(html, "html.parser")
+
+
+class TestExtractImageUrls:
+    """Test image URL extraction."""
+
+    def test_resolves_and_dedupes_img_tags(self) -> None:
+        """Relative sources are resolved and duplicates dropped in order."""
+        soup = _soup(
+            '<img src="a.jpg"><img data-src="/b.png"><img src="a.jpg">'
+            '<img src="icon.svg"><img src="">'
+        )
+        assert extract_image_urls(soup, BASE_URL) == [
+            "https://example.com/gallery/a.jpg",
+            "https://example.com/b.png",
+        ]
+
+    def test_background_image_urls(self) -> None:
+        """url() in style attributes is matched for every quoting style."""
+        soup = _soup(
+            "<div style=\"background-image: url('one.jpg')\"></div>"
+            '<div style=\'background: url("two.jpg")\'></div>'
+            '<div style="background-image: url(three.jpg)"></div>'
+        )
+        assert extract_image_urls(soup, BASE_URL) == [
+            "https://example.com/gallery/one.jpg",
+            "https://example.com/gallery/two.jpg",
+            "https://example.com/gallery/three.jpg",
+        ]
+
+    def test_repeated_sources_returned_once(self) -> None:
+        """Repeated img and background sources are deduplicated in discovery order."""
+        soup = _soup(
+            '<img src="1.jpg"><img src="1.jpg"><img src="2.jpg">'
+            '<div style="background-image: url(1.jpg)"></div>'
+        )
+        assert extract_image_urls(soup, BASE_URL) == [
+            "https://example.com/gallery/1.jpg",
+            "https://example.com/gallery/2.jpg",
+        ]
+
+    def test_img_tags_take_priority_over_backgrounds(self) -> None:
+        """img sources come before background images, regardless of position."""
+        soup = _soup(
+            '<div style="background-image: url(bg.jpg)"></div>'
+            '<img src="1.jpg" style="background: url(img-bg.jpg)"><img src="2.jpg">'
+        )
+        assert extract_image_urls(soup, BASE_URL) == [
+            "https://example.com/gallery/1.jpg",
+            "https://example.com/gallery/2.jpg",
+            "https://example.com/gallery/bg.jpg",
+            "https://example.com/gallery/img-bg.jpg",
+        ]
+
+
+class TestExtractBioText:
+    """Test bio text extraction."""
+
+    def test_sections_follow_selector_priority(self) -> None:
+        """Sections are ordered by selector, not document position, and deduplicated."""
+        about = "About the studio. " * 10
+        bio = "Artist biography. " * 10
+        soup = _soup(
+            f'<div class="about">{about}</div>'
+            f"<article>{bio}</article>"
+            f'<div id="bio" class="bio">{bio}</div>'
+        )
+        text = extract_bio_text(soup)
+        assert text.split("\n\n---\n\n") == [bio.strip(), about.strip()]
+
+    def test_stops_at_max_sections(self) -> None:
+        """Only the first MAX_SECTIONS distinct sections are returned."""
+        posts = [f"Post {i}. " + "Lorem ipsum dolor sit amet. " * 5 for i in range(8)]
+        soup = _soup("".join(f"<article>{post}</article>" for post in [posts[0], *posts]))
+        assert extract_bio_text(soup).split("\n\n---\n\n") == [p.strip() for p in posts[:5]]
+
+    def test_ignores_short_sections(self) -> None:
+        """Containers below the minimum length are skipped."""
+        assert extract_bio_text(_soup('<div class="bio">Short.</div>')) == ""
+
+
+class TestExtractPhones:
+    """Test phone number extraction."""
+
+    def test_text_numbers_in_document_order(self) -> None:
+        """tel: links come first, then text matches in order, without partial re-matches."""
+        soup = _soup(
+            "<p>Call +1 234 567 8901 or (555) 123-4567, Paris +33 12 345 67 89</p>"
+            '<a href="tel:+44 20 7946 0000">Phone</a>'
+        )
+        assert extract_phones(soup) == [
+            "+442079460000",
+            "+12345678901",
+            "5551234567",
+            "+33123456789",
+        ]
+
+
+class TestExtractLocation:
+    """Test location extraction."""
+
+    def test_candidates_follow_selector_priority(self) -> None:
+        """Location containers are ordered by selector, not document position."""
+        soup = _soup(
+            '<span data-location="x">Studio in Oslo</span>'
+            '<div class="city">Berlin</div>'
+            '<div class="based-in">Paris, France</div>'
+            f'<div class="based-in">{"x" * 120}</div>'
+        )
+        assert extract_location(soup) == (
+            "Paris, France",
+            ["Paris, France", "Berlin", "Studio in Oslo"],
+        )
+
+
+class TestExtractPageLinks:
+    """Test single-pass link extraction."""
+
+    def test_matches_individual_extractors(self) -> None:
+        """One pass gives the same results as the separate extractors."""
+        soup = _soup(
+            '<a href="mailto:Studio@Example.com?subject=Hi">Mail</a>'
+            '<a href="tel:+1 (555) 123-4567">Call</a>'
+            '<a href="/files/CV_2024.pdf">Download</a>'
+            '<a href="catalogue.pdf">Resume</a>'
+            '<a href="/files/press.pdf">Press</a>'
+            '<a href="/files/press.pdf">Press again</a>'
+            '<a href="/contact">Contact</a>'
+            "<p>Write to info@example.com or call +44 20 7946 0000.</p>"
+        )
+
+        links = extract_page_links(soup, BASE_URL)
+
+        assert links.emails == extract_emails(soup)
+        assert links.phones == extract_phones(soup)
+        assert links.cv_links == extract_cv_links(soup, BASE_URL)
+        assert links.pdf_links == extract_pdf_links(soup, BASE_URL)
+        assert links.emails == ["studio@example.com", "info@example.com"]
+        assert links.cv_links == [
+            "https://example.com/files/CV_2024.pdf",
+            "https://example.com/gallery/catalogue.pdf",
+        ]
+        assert len(links.pdf_links) == 3
+
+    def test_contacts_only_without_base_url(self) -> None:
+        """Without a base URL, emails and phones are collected but no document links."""
+        soup = _soup(
+            '<a href="mailto:studio@example.com">Mail</a><a href="/files/CV.pdf">CV</a>'
+            "<p>Call (555) 123-4567</p>"
+        )
+
+        links = extract_page_links(soup)
+
+        assert links.emails == ["studio@example.com"]
+        assert links.phones == ["5551234567"]
+        assert links.cv_links == links.pdf_links == []
+
+    def test_only_requested_parts_are_collected(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Unrequested lists stay empty, and document-only calls skip the text scan."""
+        soup = _soup(
+            '<a href="mailto:studio@example.com">Mail</a><a href="tel:5551234567">Call</a>'
+            '<a href="/files/CV.pdf">CV</a><a href="/files/press.pdf">Press</a>'
+        )
+
+        emails_only = extract_page_links(
+            soup, BASE_URL, phones=False, cv_links=False, pdf_links=False
+        )
+        assert emails_only == PageLinks(emails=["studio@example.com"])
+
+        def _no_text_scan(*args: object, **kwargs: object) -> str:
+            raise AssertionError("page text scanned for a document-only call")
+
+        monkeypatch.setattr(soup, "get_text", _no_text_scan)
+        assert extract_pdf_links(soup, BASE_URL) == [
+            "https://example.com/files/CV.pdf",
+            "https://example.com/files/press.pdf",
+        ]
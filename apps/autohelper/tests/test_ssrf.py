@@ -0,0 +1,243 @@
+"""Tests for SSRF URL validation and the protected client."""
+
+import asyncio
+import ipaddress
+import socket
+from collections.abc import Callable
+
+import httpx
+import pytest
+
+from autohelper.modules.runner.ssrf import PRIVATE_IP_RANGES, SSRFProtectedClient, validation
+from autohelper.modules.runner.ssrf import client as client_module
+from autohelper.modules.runner.ssrf.validation import is_safe_url
+
+
+@pytest.fixture(autouse=True)
+def clear_dns_cache() -> None:
+    """Start every test with an empty DNS cache."""
+    validation._dns_cache.clear()
+
+
+@pytest.fixture
+def no_dns(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Fail the test if hostname resolution is attempted."""
+
+    async def _fail(hostname: str) -> list[str]:
+        raise AssertionError(f"unexpected DNS lookup for {hostname}")
+
+    monkeypatch.setattr(validation, "_resolve_all_ips", _fail)
+
+
+class TestIsSafeUrl:
+    """Test URL validation for SSRF protection."""
+
+    async def test_rejects_unsupported_scheme(self) -> None:
+        """Only http/https URLs are allowed."""
+        is_safe, error = await is_safe_url("file:///etc/passwd")
+        assert not is_safe
+        assert "scheme" in error
+
+    async def test_rejects_blocked_hostname(self, no_dns: None) -> None:
+        """Blocklisted hostnames are rejected without resolution."""
+        is_safe, _ = await is_safe_url("http://metadata.google.internal/")
+        assert not is_safe
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "http://127.0.0.1/",
+            "http://0.0.0.0/",
+            "http://10.1.2.3/",
+            "http://169.254.169.254/latest/meta-data",
+            "http://[::1]/",
+            "http://[fe80::1%25eth0]/",
+        ],
+    )
+    async def test_rejects_private_ip_literals(self, url: str, no_dns: None) -> None:
+        """Private and loopback IP literals are rejected without DNS."""
+        is_safe, _ = await is_safe_url(url)
+        assert not is_safe
+
+    @pytest.mark.parametrize("url", ["http://8.8.8.8/", "https://[2001:4860::8888]/img.png"])
+    async def test_allows_public_ip_literals(self, url: str, no_dns: None) -> None:
+        """Public IP literals pass without DNS."""
+        is_safe, error = await is_safe_url(url)
+        assert is_safe
+        assert error == ""
+
+    async def test_rejects_hostname_resolving_to_private_ip(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Hostnames resolving to private ranges are rejected."""
+
+        async def _resolve(hostname: str) -> list[str]:
+            return ["192.168.1.10"]
+
+        monkeypatch.setattr(validation, "_resolve_all_ips", _resolve)
+        is_safe, error = await is_safe_url("http://intranet.example.com/")
+        assert not is_safe
+        assert "192.168.1.10" in error
+
+    async def test_reuses_cached_resolution(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Repeat lookups of a host within the TTL skip DNS."""
+        lookups: list[str] = []
+
+        async def _resolve(hostname: str) -> list[str]:
+            lookups.append(hostname)
+            return ["93.184.216.34"]
+
+        monkeypatch.setattr(validation, "_resolve_all_ips", _resolve)
+        assert (await is_safe_url("https://Example.com/a.jpg"))[0]
+        assert (await is_safe_url("https://example.com/b.jpg"))[0]
+        assert lookups == ["example.com"]
+
+    async def test_cache_entries_expire(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Resolutions older than the TTL are looked up again."""
+        lookups: list[str] = []
+
+        async def _resolve(hostname: str) -> list[str]:
+            lookups.append(hostname)
+            return ["93.184.216.34"]
+
+        monkeypatch.setattr(validation, "_resolve_all_ips", _resolve)
+        await is_safe_url("https://example.com/")
+        ips, resolved_at = validation._dns_cache["example.com"]
+        validation._dns_cache["example.com"] = (
+            ips,
+            resolved_at - validation.DNS_CACHE_TTL_SECONDS,
+        )
+        await is_safe_url("https://example.com/")
+        assert lookups == ["example.com", "example.com"]
+
+
+class TestResolveAllIps:
+    """Test hostname resolution."""
+
+    async def test_returns_unique_ips_of_all_families(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """IPv4 and IPv6 results are both returned, without duplicates."""
+
+        async def _getaddrinfo(host: str, port: int | None, **kwargs: object) -> list[tuple]:
+            return [
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0)),
+                (socket.AF_INET6, socket.SOCK_STREAM, 6, "", ("::1", 0, 0, 0)),
+                (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0)),
+            ]
+
+        monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", _getaddrinfo)
+        assert await validation._resolve_all_ips("example.com") == ["93.184.216.34", "::1"]
+        is_safe, error = await is_safe_url("https://example.com/")
+        assert not is_safe
+        assert "::1" in error
+
+    async def test_raises_on_resolution_failure(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Resolver errors surface as DNSResolutionError."""
+
+        async def _getaddrinfo(host: str, port: int | None, **kwargs: object) -> list[tuple]:
+            raise socket.gaierror(socket.EAI_NONAME, "Name or service not known")
+
+        monkeypatch.setattr(asyncio.get_running_loop(), "getaddrinfo", _getaddrinfo)
+        with pytest.raises(validation.DNSResolutionError):
+            await validation._resolve_all_ips("nonexistent.invalid")
+
+
+class TestCheckIpsAgainstPrivateRanges:
+    """Test private range membership checks."""
+
+    def test_matches_network_membership_at_range_edges(self) -> None:
+        """Addresses just inside and outside every range match ip_network membership."""
+        candidates: list[str] = []
+        for network in PRIVATE_IP_RANGES:
+            first = int(network.network_address)
+            last = int(network.broadcast_address)
+            for value in (first - 1, first, last, last + 1):
+                if 0 <= value < 2**network.max_prefixlen:
+                    candidates.append(str(ipaddress.ip_address(value)))
+
+        for ip_str in candidates:
+            ip = ipaddress.ip_address(ip_str)
+            expected = any(ip in network for network in PRIVATE_IP_RANGES)
+            is_private, _ = validation._check_ips_against_private_ranges([ip_str])
+            assert is_private == expected, ip_str
+
+    def test_scoped_ipv6_address(self) -> None:
+        """Resolver results with an IPv6 zone ID are still range-checked."""
+        is_private, error = validation._check_ips_against_private_ranges(["fe80::1%eth0"])
+        assert is_private
+        assert "fe80::1%eth0" in error
+
+    def test_skips_invalid_addresses(self) -> None:
+        """Unparseable entries are ignored."""
+        assert validation._check_ips_against_private_ranges(["not-an-ip", "8.8.8.8"]) == (
+            False,
+            "",
+        )
+
+
+def _mock_client(handler: Callable[[httpx.Request], httpx.Response]) -> SSRFProtectedClient:
+    """Build a client whose pool is backed by an in-process transport."""
+    client = SSRFProtectedClient()
+    client._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), follow_redirects=False
+    )
+    return client
+
+
+class TestSSRFProtectedClient:
+    """Test redirect handling in the SSRF-protected client."""
+
+    @pytest.fixture(autouse=True)
+    def public_dns(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        async def _resolve(hostname: str) -> list[str]:
+            return ["93.184.216.34"]
+
+        monkeypatch.setattr(validation, "_resolve_all_ips", _resolve)
+
+    async def test_stream_follows_redirects(self) -> None:
+        """stream() follows safe redirects and yields the unread final body."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/old.jpg":
+                return httpx.Response(302, headers={"location": "/new.jpg"})
+            return httpx.Response(200, content=b"x" * 100_000)
+
+        client = _mock_client(handler)
+        async with client, client.stream("https://example.com/old.jpg") as response:
+            assert str(response.url) == "https://example.com/new.jpg"
+            chunks = [chunk async for chunk in response.aiter_bytes(65536)]
+        assert [len(chunk) for chunk in chunks] == [65536, 100_000 - 65536]
+
+    async def test_blocks_redirect_to_private_ip(self) -> None:
+        """Redirects to private addresses are rejected."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(302, headers={"location": "http://169.254.169.254/"})
+
+        async with _mock_client(handler) as client:
+            with pytest.raises(ValueError, match="Unsafe redirect"):
+                await client.get("https://example.com/")
+
+    async def test_validates_each_host_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Requests and redirects on already validated hosts skip is_safe_url."""
+        checked: list[str] = []
+
+        async def _is_safe_url(url: str) -> tuple[bool, str]:
+            checked.append(url)
+            return await is_safe_url(url)
+
+        monkeypatch.setattr(client_module, "is_safe_url", _is_safe_url)
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/old.jpg":
+                return httpx.Response(302, headers={"location": "https://cdn.example.com/a.jpg"})
+            return httpx.Response(200)
+
+        async with _mock_client(handler) as client:
+            await client.get("https://example.com/old.jpg")
+            await client.get("https://example.com/b.jpg")
+            await client.head("https://cdn.example.com/a.jpg")
+            assert await client.check_url("https://CDN.example.com/c.jpg") == (True, "")
+
+        assert checked == ["https://example.com/old.jpg", "https://cdn.example.com/a.jpg"]